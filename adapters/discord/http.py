@@ -2,9 +2,15 @@
 Discord REST API 클라이언트
 """
 import asyncio
+import functools
+import os
+import re
 import time
-from typing import Any, Dict, List, Optional, Union
+from urllib.parse import quote, urlencode
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
 import aiohttp
+import orjson
+from pydantic import TypeAdapter
 from loguru import logger
 
 from ...core.retry import retry_with_backoff, RateLimitError, TimeoutError, DiscordAPIError
@@ -18,14 +24,62 @@ from .models import (
 )
 
 
+# @everyone, @here 멘션 치환 (전각문자)
+_MENTION_RE = re.compile(r"@(everyone|here)")
+_MENTION_SUB = {"everyone": "＠everyone", "here": "＠here"}
+
+# 멘션 비활성화 (직렬화 전용으로 공유하므로 수정 금지)
+_ALLOWED_MENTIONS_NONE = {"parse": []}
+
+# ":name:" 형식은 콜론 제거, 공백은 밑줄로 치환
+_EMOJI_SHORTCODE_TRANS = str.maketrans({":": "", " ": "_"})
+_EMOJI_SPACE_TRANS = str.maketrans({" ": "_"})
+
+
+def _encode_emoji(emoji: str) -> str:
+    """리액션 엔드포인트용 이모지 정리 및 URL 인코딩"""
+    table = _EMOJI_SHORTCODE_TRANS if emoji.startswith(":") else _EMOJI_SPACE_TRANS
+    return quote(emoji.translate(table), safe="")
+
+
+# 메시지 목록 일괄 검증기 (JSON bytes에서 바로 모델 생성)
+_MESSAGE_LIST = TypeAdapter(List[DiscordMessage])
+
+
+def _serialize_embeds(embeds: List[DiscordEmbed]) -> List[Dict[str, Any]]:
+    """임베드 목록을 JSON 호환 dict로 변환 (model_dump 래퍼를 거치지 않고 pydantic-core 직렬화기 직접 호출)"""
+    return [embed.__pydantic_serializer__.to_python(embed, mode="json") for embed in embeds]
+
+
 class DiscordClient:
     """Discord REST API 클라이언트"""
     
-    def __init__(self, bot_token: str, base_url: str = "https://discord.com/api/v10"):
+    def __init__(
+        self,
+        bot_token: str,
+        base_url: str = "https://discord.com/api/v10",
+        connection_limit: int = 0,
+        connection_limit_per_host: Optional[int] = None
+    ):
         self.bot_token = bot_token
         self.base_url = base_url
+        # 커넥션 풀 크기 (0: 제한 없음). Discord API는 단일 호스트이므로 호스트당 제한이 실질적인 상한
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = (
+            connection_limit_per_host
+            if connection_limit_per_host is not None
+            else int(os.getenv("DISCORD_HTTP_LIMIT_PER_HOST", "256"))
+        )
         self.session: Optional[aiohttp.ClientSession] = None
+        # 웹훅 전용 세션 (Bot 인증 헤더가 웹훅 URL로 전송되지 않도록 분리)
+        self.webhook_session: Optional[aiohttp.ClientSession] = None
         self._connected = False
+        # 진행 중인 GET 요청 (동일 요청 병합용)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # 무효화 대기 중인 채널 (짧은 구간 안의 쓰기는 한 번의 무효화로 합침)
+        self._pending_invalidations: Set[str] = set()
+        self._invalidation_task: Optional[asyncio.Task] = None
+        self.invalidation_delay = 0.05
         
         # 기본 헤더
         self.default_headers = {
@@ -38,7 +92,14 @@ class DiscordClient:
         """세션 연결"""
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=30)
-            connector = aiohttp.TCPConnector(limit=100, limit_per_host=30)
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+                keepalive_timeout=75
+            )
             
             self.session = aiohttp.ClientSession(
                 headers=self.default_headers,
@@ -46,6 +107,8 @@ class DiscordClient:
                 connector=connector
             )
             
+            self._ensure_webhook_session()
+            
             # 연결 테스트
             try:
                 await self._make_request("GET", "/users/@me")
@@ -60,11 +123,79 @@ class DiscordClient:
     
     async def disconnect(self) -> None:
         """세션 연결 해제"""
+        # 예약된 캐시 무효화는 바로 실행 (취소된 예약 작업이 되돌린 채널까지 포함)
+        task = self._invalidation_task
+        if task and not task.done():
+            task.cancel()
+            await asyncio.wait([task])
+        self._invalidation_task = None
+        await self._flush_invalidations()
+        
         if self.session and not self.session.closed:
             await self.session.close()
             self._connected = False
             health_checker.update_discord_status(False)
             logger.info("Disconnected from Discord API")
+        
+        if self.webhook_session and not self.webhook_session.closed:
+            await self.webhook_session.close()
+        self.webhook_session = None
+    
+    def _invalidate_channel_later(self, channel_id: str) -> None:
+        """채널 캐시 무효화 예약"""
+        self._pending_invalidations.add(channel_id)
+        if self._invalidation_task is None or self._invalidation_task.done():
+            self._invalidation_task = asyncio.create_task(self._flush_invalidations_later())
+    
+    async def _flush_invalidations_later(self) -> None:
+        """잠시 모은 뒤 예약된 캐시 무효화 실행"""
+        await asyncio.sleep(self.invalidation_delay)
+        await self._flush_invalidations()
+    
+    async def _flush_invalidations(self) -> None:
+        """예약된 채널 캐시 무효화를 한 번에 실행
+        
+        실패하거나 취소되면 채널을 대기열로 되돌려 다음 읽기/쓰기/종료 시 다시 시도
+        (백그라운드 작업에서 예외가 빠져나가지 않도록 실패는 로그만 남김)
+        """
+        if not self._pending_invalidations:
+            return
+        
+        channel_ids = self._pending_invalidations
+        self._pending_invalidations = set()
+        try:
+            await discord_cache.invalidate_channels(list(channel_ids))
+        except asyncio.CancelledError:
+            self._pending_invalidations.update(channel_ids)
+            raise
+        except Exception as e:
+            self._pending_invalidations.update(channel_ids)
+            logger.warning(
+                "Channel cache invalidation failed",
+                channel_count=len(channel_ids),
+                error=str(e)
+            )
+    
+    async def _ensure_invalidated(self, *channel_ids: str) -> None:
+        """무효화 대기 중인 채널을 읽기 전에 먼저 무효화 (쓰기 직후 읽기에서 이전 캐시 방지)"""
+        if self._pending_invalidations and not self._pending_invalidations.isdisjoint(channel_ids):
+            await self._flush_invalidations()
+    
+    def _ensure_webhook_session(self) -> aiohttp.ClientSession:
+        """웹훅 세션 생성 (재사용)"""
+        if self.webhook_session is None or self.webhook_session.closed:
+            self.webhook_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=75)
+            )
+        return self.webhook_session
+    
+    @staticmethod
+    def _request_key(endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+        """GET 요청 키 생성 (정렬된 쿼리스트링 사용)"""
+        if params:
+            return f"GET:{endpoint}?{urlencode(sorted(params.items()))}"
+        return f"GET:{endpoint}"
     
     async def _make_request(
         self,
@@ -73,38 +204,77 @@ class DiscordClient:
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         use_cache: bool = False,
-        cache_ttl: int = 300
-    ) -> Dict[str, Any]:
-        """HTTP 요청 실행"""
+        cache_ttl: int = 300,
+        raw: bool = False
+    ) -> Any:
+        """HTTP 요청 실행 (동일한 GET 요청이 진행 중이면 그 결과를 공유)"""
+        if method != "GET":
+            return await self._send_request(method, endpoint, data, params, use_cache, cache_ttl, raw)
+        
+        request_key = self._request_key(endpoint, params)
+        if raw:
+            request_key += "#raw"
+        task = self._inflight.get(request_key)
+        if task is None:
+            # 실제 요청은 별도 태스크로 실행 (호출자 하나가 취소되어도 공유 요청은 계속됨)
+            task = asyncio.create_task(
+                self._send_request(method, endpoint, data, params, use_cache, cache_ttl, raw)
+            )
+            self._inflight[request_key] = task
+            task.add_done_callback(functools.partial(self._finish_inflight, request_key))
+        
+        # 첫 호출자를 포함해 모든 호출자가 shield로 대기
+        return await asyncio.shield(task)
+    
+    def _finish_inflight(self, request_key: str, task: asyncio.Task) -> None:
+        """완료된 공유 요청 정리"""
+        if self._inflight.get(request_key) is task:
+            del self._inflight[request_key]
+        # 대기 중인 호출자가 모두 취소된 경우에도 "exception was never retrieved" 경고가 나지 않도록 처리
+        if not task.cancelled():
+            task.exception()
+    
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+        cache_ttl: int = 300,
+        raw: bool = False
+    ) -> Any:
+        """HTTP 요청 전송 (raw=True이면 응답 본문 bytes를 그대로 반환하며 응답 캐시는 사용하지 않음)"""
         if not self.session:
             await self.connect()
         
-        url = f"{self.base_url}{endpoint}"
-        start_time = time.time()
+        url = self.base_url + endpoint
+        start_time = time.monotonic()
         
         try:
-            # Rate limit 확인
-            await discord_rate_limiter.check_rate_limit(endpoint)
-            
             # 캐시 확인 (GET 요청만)
-            if use_cache and method == "GET":
-                cache_key = f"{method}:{endpoint}:{params or {}}"
+            cache_key = None
+            if use_cache and method == "GET" and not raw:
+                cache_key = self._request_key(endpoint, params)
                 cached_response = await discord_cache.cache.get(cache_key)
                 if cached_response:
                     logger.debug(f"Cache hit for {endpoint}")
                     return cached_response
             
+            # Rate limit 확인 (캐시 히트는 토큰을 소모하지 않음)
+            await discord_rate_limiter.check_rate_limit(endpoint, method)
+            
             # 요청 실행
             async with self.session.request(
                 method=method,
                 url=url,
-                json=data,
+                data=orjson.dumps(data) if data is not None else None,
                 params=params
             ) as response:
-                latency_ms = (time.time() - start_time) * 1000
+                latency_ms = (time.monotonic() - start_time) * 1000
                 
                 # Rate limit 헤더 처리
-                await discord_rate_limiter.handle_rate_limit(endpoint, dict(response.headers))
+                discord_rate_limiter.handle_rate_limit(endpoint, response.headers, method)
                 
                 # 응답 로깅
                 log_discord_api_call(
@@ -113,7 +283,7 @@ class DiscordClient:
                     status_code=response.status,
                     latency_ms=latency_ms,
                     rate_limit_remaining=discord_rate_limiter.rate_limiter.get_remaining_requests(
-                        discord_rate_limiter._get_bucket(endpoint)
+                        discord_rate_limiter.bucket_for(method, endpoint)
                     )
                 )
                 
@@ -124,19 +294,22 @@ class DiscordClient:
                 elif response.status >= 500:
                     raise DiscordAPIError(f"Server error: {response.status}")
                 elif response.status >= 400:
-                    error_data = await response.json()
+                    error_data = orjson.loads(await response.read())
                     error_message = error_data.get("message", f"HTTP {response.status}")
                     raise DiscordAPIError(error_message, status_code=response.status)
                 
-                # 응답 데이터 파싱
-                if response.content_type == "application/json":
-                    response_data = await response.json()
+                # 응답 데이터 파싱 (204 등 본문이 없는 응답은 읽지 않음)
+                if response.status == 204 or response.content_length == 0:
+                    response_data = b"" if raw else {}
+                elif raw:
+                    response_data = await response.read()
+                elif response.content_type == "application/json":
+                    response_data = orjson.loads(await response.read())
                 else:
                     response_data = {"text": await response.text()}
                 
                 # 캐시 저장 (GET 요청만)
-                if use_cache and method == "GET" and response.status == 200:
-                    cache_key = f"{method}:{endpoint}:{params or {}}"
+                if cache_key is not None and response.status == 200:
                     await discord_cache.cache.set(cache_key, response_data, cache_ttl)
                 
                 # 메트릭 기록
@@ -151,7 +324,7 @@ class DiscordClient:
         except asyncio.TimeoutError:
             raise TimeoutError("Request timeout")
         except Exception as e:
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.monotonic() - start_time) * 1000
             health_checker.record_request(success=False, latency=latency_ms / 1000)
             raise
     
@@ -162,18 +335,43 @@ class DiscordClient:
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         use_cache: bool = False,
-        cache_ttl: int = 300
-    ) -> Dict[str, Any]:
-        """재시도와 함께 HTTP 요청 실행"""
-        return await retry_with_backoff(
-            self._make_request,
-            method=method,
-            endpoint=endpoint,
-            data=data,
-            params=params,
-            use_cache=use_cache,
-            cache_ttl=cache_ttl
+        cache_ttl: int = 300,
+        raw: bool = False
+    ) -> Any:
+        """재시도와 함께 HTTP 요청 실행 (인자는 한 번만 바인딩하고 시도마다 그대로 호출)"""
+        call = functools.partial(
+            self._make_request, method, endpoint, data, params, use_cache, cache_ttl, raw
+        )
+        return await retry_with_backoff(call)
+    
+    async def _get_many_cached(
+        self,
+        ids: List[str],
+        cache_get_many: Callable[[List[str]], Awaitable[List[Optional[Dict[str, Any]]]]],
+        cache_set: Callable[[str, Dict[str, Any]], Awaitable[bool]],
+        endpoint_for: Callable[[str], str]
+    ) -> List[Dict[str, Any]]:
+        """캐시 미스 항목만 동시에 조회 (요청 순서 유지, 실패 항목 제외)"""
+        cached = await cache_get_many(ids)
+        found: Dict[str, Dict[str, Any]] = {
+            item_id: data for item_id, data in zip(ids, cached) if data
+        }
+        misses = [item_id for item_id in dict.fromkeys(ids) if item_id not in found]
+        
+        # 캐시 미스 항목 동시 조회
+        responses = await asyncio.gather(
+            *(self._make_request_with_retry("GET", endpoint_for(item_id), use_cache=True) for item_id in misses),
+            return_exceptions=True
         )
+        
+        for item_id, response in zip(misses, responses):
+            if isinstance(response, BaseException):
+                logger.warning(f"Failed to fetch {endpoint_for(item_id)}: {response}")
+                continue
+            found[item_id] = response
+            await cache_set(item_id, response)
+        
+        return [found[item_id] for item_id in ids if item_id in found]
     
     # Guild 관련 메서드
     async def get_guilds(self) -> List[DiscordGuild]:
@@ -196,6 +394,16 @@ class DiscordClient:
         
         return guild
     
+    async def get_guilds_by_ids(self, guild_ids: List[str]) -> List[DiscordGuild]:
+        """여러 길드 정보 동시 조회"""
+        guilds = await self._get_many_cached(
+            guild_ids,
+            discord_cache.get_guilds,
+            discord_cache.set_guild,
+            lambda guild_id: f"/guilds/{guild_id}"
+        )
+        return [DiscordGuild(**guild) for guild in guilds]
+    
     # Channel 관련 메서드
     async def get_channels(self, guild_id: str) -> List[DiscordChannel]:
         """길드의 채널 목록 조회"""
@@ -204,6 +412,8 @@ class DiscordClient:
     
     async def get_channel(self, channel_id: str) -> DiscordChannel:
         """채널 정보 조회"""
+        await self._ensure_invalidated(channel_id)
+        
         # 캐시에서 먼저 확인
         cached_channel = await discord_cache.get_channel(channel_id)
         if cached_channel:
@@ -217,6 +427,18 @@ class DiscordClient:
         
         return channel
     
+    async def get_channels_by_ids(self, channel_ids: List[str]) -> List[DiscordChannel]:
+        """여러 채널 정보 동시 조회"""
+        await self._ensure_invalidated(*channel_ids)
+        
+        channels = await self._get_many_cached(
+            channel_ids,
+            discord_cache.get_channels,
+            discord_cache.set_channel,
+            lambda channel_id: f"/channels/{channel_id}"
+        )
+        return [DiscordChannel(**channel) for channel in channels]
+    
     async def create_channel(
         self,
         guild_id: str,
@@ -260,8 +482,8 @@ class DiscordClient:
         response = await self._make_request_with_retry("PATCH", f"/channels/{channel_id}", data=data)
         channel = DiscordChannel(**response)
         
-        # 캐시 무효화
-        await discord_cache.invalidate_channel(channel_id)
+        # 캐시 무효화 (예약)
+        self._invalidate_channel_later(channel_id)
         
         return channel
     
@@ -269,8 +491,8 @@ class DiscordClient:
         """채널 삭제"""
         await self._make_request_with_retry("DELETE", f"/channels/{channel_id}")
         
-        # 캐시 무효화
-        await discord_cache.invalidate_channel(channel_id)
+        # 캐시 무효화 (예약)
+        self._invalidate_channel_later(channel_id)
     
     # Message 관련 메서드
     async def get_messages(
@@ -290,23 +512,30 @@ class DiscordClient:
         if around:
             params["around"] = around
         
+        await self._ensure_invalidated(channel_id)
+        
+        # 캐시 키에 before/around가 없으므로 페이지 조회는 캐시하지 않음
+        cacheable = not before and not around
+        
         # 캐시에서 먼저 확인
-        cached_messages = await discord_cache.get_messages(channel_id, limit, after)
-        if cached_messages:
-            return [DiscordMessage(**msg) for msg in cached_messages.get("messages", [])]
+        if cacheable:
+            cached_messages = await discord_cache.get_messages(channel_id, limit, after)
+            if cached_messages:
+                return _MESSAGE_LIST.validate_json(cached_messages)
         
+        # 응답 본문을 그대로 받아 한 번에 파싱/검증
         response = await self._make_request_with_retry(
             "GET", 
             f"/channels/{channel_id}/messages", 
             params=params,
-            use_cache=True,
-            cache_ttl=60  # 메시지는 짧은 TTL
+            raw=True
         )
         
-        messages = [DiscordMessage(**msg) for msg in response]
+        messages = _MESSAGE_LIST.validate_json(response)
         
-        # 캐시에 저장
-        await discord_cache.set_messages(channel_id, {"messages": response}, limit, after)
+        # 캐시에 저장 (메시지는 짧은 TTL)
+        if cacheable:
+            await discord_cache.set_messages(channel_id, response, limit, after)
         
         return messages
     
@@ -315,12 +544,72 @@ class DiscordClient:
         response = await self._make_request_with_retry("GET", f"/channels/{channel_id}/messages/{message_id}")
         return DiscordMessage(**response)
     
+    async def get_messages_bulk(self, channel_id: str, message_ids: List[str]) -> List[DiscordMessage]:
+        """여러 메시지 동시 조회 (요청 순서 유지, 실패 항목 제외)"""
+        responses = await asyncio.gather(
+            *(
+                self._make_request_with_retry("GET", f"/channels/{channel_id}/messages/{message_id}")
+                for message_id in message_ids
+            ),
+            return_exceptions=True
+        )
+        
+        messages = []
+        for message_id, response in zip(message_ids, responses):
+            if isinstance(response, BaseException):
+                logger.warning(f"Failed to fetch message {message_id} in channel {channel_id}: {response}")
+                continue
+            messages.append(DiscordMessage(**response))
+        
+        return messages
+    
+    async def iter_messages(
+        self,
+        channel_id: str,
+        limit: Optional[int] = None,
+        before: Optional[str] = None,
+        batch: int = 100
+    ) -> AsyncIterator[DiscordMessage]:
+        """메시지를 최신순으로 페이지 단위 순회 (소비하는 동안 다음 페이지를 미리 요청)"""
+        batch = min(batch, 100)  # Discord 최대 제한
+        remaining = limit
+        
+        def fetch(cursor: Optional[str], size: int) -> "asyncio.Task[bytes]":
+            params = {"limit": size}
+            if cursor:
+                params["before"] = cursor
+            return asyncio.create_task(self._make_request_with_retry(
+                "GET", f"/channels/{channel_id}/messages", params=params, raw=True
+            ))
+        
+        pending: Optional[asyncio.Task] = fetch(before, batch if remaining is None else min(batch, remaining))
+        try:
+            while pending is not None:
+                page = _MESSAGE_LIST.validate_json(await pending)
+                pending = None
+                if not page:
+                    return
+                
+                if remaining is not None:
+                    page = page[:remaining]
+                    remaining -= len(page)
+                
+                # 페이지가 가득 찼으면 다음 페이지를 먼저 요청
+                if len(page) == batch and remaining != 0:
+                    pending = fetch(page[-1].id, batch if remaining is None else min(batch, remaining))
+                
+                for message in page:
+                    yield message
+        finally:
+            if pending is not None:
+                pending.cancel()
+    
     def _sanitize_content(self, content: str) -> str:
         """메시지 내용 정리 (멘션 필터링)"""
-        # @everyone, @here를 전각문자로 치환
-        content = content.replace("@everyone", "＠everyone")
-        content = content.replace("@here", "＠here")
-        return content
+        # @everyone, @here를 전각문자로 치환 (멘션이 없는 대부분의 메시지는 스캔 생략)
+        if "@" not in content:
+            return content
+        return _MENTION_RE.sub(lambda match: _MENTION_SUB[match.group(1)], content)
     
     async def send_message(
         self,
@@ -336,16 +625,16 @@ class DiscordClient:
         data = {
             "content": content,
             "tts": tts,
-            "allowed_mentions": {"parse": []}  # 멘션 비활성화
+            "allowed_mentions": _ALLOWED_MENTIONS_NONE
         }
         
         if embeds:
-            data["embeds"] = [embed.model_dump() for embed in embeds]
+            data["embeds"] = _serialize_embeds(embeds)
         
         response = await self._make_request_with_retry("POST", f"/channels/{channel_id}/messages", data=data)
         
-        # 캐시 무효화
-        await discord_cache.invalidate_channel(channel_id)
+        # 캐시 무효화 (예약)
+        self._invalidate_channel_later(channel_id)
         
         return DiscordMessage(**response)
     
@@ -362,12 +651,12 @@ class DiscordClient:
         
         data = {"content": content}
         if embeds:
-            data["embeds"] = [embed.model_dump() for embed in embeds]
+            data["embeds"] = _serialize_embeds(embeds)
         
         response = await self._make_request_with_retry("PATCH", f"/channels/{channel_id}/messages/{message_id}", data=data)
         
-        # 캐시 무효화
-        await discord_cache.invalidate_channel(channel_id)
+        # 캐시 무효화 (예약)
+        self._invalidate_channel_later(channel_id)
         
         return DiscordMessage(**response)
     
@@ -375,8 +664,8 @@ class DiscordClient:
         """메시지 삭제"""
         await self._make_request_with_retry("DELETE", f"/channels/{channel_id}/messages/{message_id}")
         
-        # 캐시 무효화
-        await discord_cache.invalidate_channel(channel_id)
+        # 캐시 무효화 (예약)
+        self._invalidate_channel_later(channel_id)
     
     async def search_messages(
         self,
@@ -456,9 +745,7 @@ class DiscordClient:
     async def add_reaction(self, channel_id: str, message_id: str, emoji: str) -> None:
         """리액션 추가"""
         # 이모지 URL 인코딩
-        if emoji.startswith(":"):
-            emoji = emoji.replace(":", "")
-        emoji = emoji.replace(" ", "_")
+        emoji = _encode_emoji(emoji)
         
         await self._make_request_with_retry(
             "PUT", 
@@ -468,9 +755,7 @@ class DiscordClient:
     async def remove_reaction(self, channel_id: str, message_id: str, emoji: str) -> None:
         """리액션 제거"""
         # 이모지 URL 인코딩
-        if emoji.startswith(":"):
-            emoji = emoji.replace(":", "")
-        emoji = emoji.replace(" ", "_")
+        emoji = _encode_emoji(emoji)
         
         await self._make_request_with_retry(
             "DELETE", 
@@ -486,9 +771,7 @@ class DiscordClient:
     ) -> List[DiscordUser]:
         """리액션 사용자 목록 조회"""
         # 이모지 URL 인코딩
-        if emoji.startswith(":"):
-            emoji = emoji.replace(":", "")
-        emoji = emoji.replace(" ", "_")
+        emoji = _encode_emoji(emoji)
         
         response = await self._make_request_with_retry(
             "GET", 
@@ -556,11 +839,15 @@ class DiscordClient:
         if avatar_url:
             data["avatar_url"] = avatar_url
         if embeds:
-            data["embeds"] = [embed.model_dump() for embed in embeds]
+            data["embeds"] = _serialize_embeds(embeds)
         
         # 웹훅은 별도 세션 사용
-        async with aiohttp.ClientSession() as session:
-            async with session.post(webhook_url, json=data) as response:
-                if response.status >= 400:
-                    error_text = await response.text()
-                    raise DiscordAPIError(f"Webhook error: {error_text}", status_code=response.status)
+        session = self._ensure_webhook_session()
+        async with session.post(
+            webhook_url,
+            data=orjson.dumps(data),
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            if response.status >= 400:
+                error_text = await response.text()
+                raise DiscordAPIError(f"Webhook error: {error_text}", status_code=response.status)
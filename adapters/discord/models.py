@@ -1,12 +1,17 @@
 """
 Discord 데이터 모델
 """
+from enum import IntEnum
 from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class DiscordUser(BaseModel):
+class DiscordModel(BaseModel):
+    """Discord API 데이터 모델 기본 클래스 (읽기 전용, 알 수 없는 필드는 무시)"""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+class DiscordUser(DiscordModel):
     """Discord 사용자 모델"""
     id: str = Field(..., description="사용자 ID")
     username: str = Field(..., description="사용자명")
@@ -25,8 +30,11 @@ class DiscordUser(BaseModel):
     public_flags: int = Field(0, description="공개 플래그")
 
 
-class DiscordGuild(BaseModel):
+class DiscordGuild(DiscordModel):
     """Discord 길드 모델"""
+    # 자주 쓰이지 않으므로 검증기는 첫 사용 시 생성
+    model_config = ConfigDict(defer_build=True)
+    
     id: str = Field(..., description="길드 ID")
     name: str = Field(..., description="길드 이름")
     icon: Optional[str] = Field(None, description="아이콘 해시")
@@ -43,8 +51,8 @@ class DiscordGuild(BaseModel):
     verification_level: int = Field(0, description="인증 레벨")
     default_message_notifications: int = Field(0, description="기본 메시지 알림")
     explicit_content_filter: int = Field(0, description="명시적 콘텐츠 필터")
-    roles: List[Dict[str, Any]] = Field(default_factory=list, description="역할 목록")
-    emojis: List[Dict[str, Any]] = Field(default_factory=list, description="이모지 목록")
+    roles: list = Field(default_factory=list, description="역할 목록")
+    emojis: list = Field(default_factory=list, description="이모지 목록")
     features: List[str] = Field(default_factory=list, description="기능 목록")
     mfa_level: int = Field(0, description="MFA 레벨")
     application_id: Optional[str] = Field(None, description="애플리케이션 ID")
@@ -65,17 +73,17 @@ class DiscordGuild(BaseModel):
     approximate_presence_count: Optional[int] = Field(None, description="대략적인 프레즌스 수")
     welcome_screen: Optional[Dict[str, Any]] = Field(None, description="환영 화면")
     nsfw_level: int = Field(0, description="NSFW 레벨")
-    stickers: List[Dict[str, Any]] = Field(default_factory=list, description="스티커 목록")
+    stickers: list = Field(default_factory=list, description="스티커 목록")
     premium_progress_bar_enabled: bool = Field(False, description="프리미엄 진행률 바 활성화")
 
 
-class DiscordChannel(BaseModel):
+class DiscordChannel(DiscordModel):
     """Discord 채널 모델"""
     id: str = Field(..., description="채널 ID")
     type: int = Field(..., description="채널 타입")
     guild_id: Optional[str] = Field(None, description="길드 ID")
     position: Optional[int] = Field(None, description="위치")
-    permission_overwrites: List[Dict[str, Any]] = Field(default_factory=list, description="권한 덮어쓰기")
+    permission_overwrites: list = Field(default_factory=list, description="권한 덮어쓰기")
     name: Optional[str] = Field(None, description="채널 이름")
     topic: Optional[str] = Field(None, description="주제")
     nsfw: bool = Field(False, description="NSFW 여부")
@@ -99,14 +107,14 @@ class DiscordChannel(BaseModel):
     permissions: Optional[str] = Field(None, description="권한")
     flags: int = Field(0, description="채널 플래그")
     total_message_sent: Optional[int] = Field(None, description="전송된 총 메시지 수")
-    available_tags: List[Dict[str, Any]] = Field(default_factory=list, description="사용 가능한 태그")
+    available_tags: list = Field(default_factory=list, description="사용 가능한 태그")
     applied_tags: List[str] = Field(default_factory=list, description="적용된 태그")
     default_reaction_emoji: Optional[Dict[str, Any]] = Field(None, description="기본 리액션 이모지")
     default_thread_rate_limit_per_user: Optional[int] = Field(None, description="기본 스레드 사용자당 속도 제한")
     default_sort_order: Optional[int] = Field(None, description="기본 정렬 순서")
 
 
-class DiscordEmbed(BaseModel):
+class DiscordEmbed(DiscordModel):
     """Discord 임베드 모델"""
     title: Optional[str] = Field(None, description="제목")
     type: str = Field("rich", description="임베드 타입")
@@ -120,10 +128,10 @@ class DiscordEmbed(BaseModel):
     video: Optional[Dict[str, Any]] = Field(None, description="비디오")
     provider: Optional[Dict[str, Any]] = Field(None, description="제공자")
     author: Optional[Dict[str, Any]] = Field(None, description="작성자")
-    fields: List[Dict[str, Any]] = Field(default_factory=list, description="필드 목록")
+    fields: list = Field(default_factory=list, description="필드 목록")
 
 
-class DiscordAttachment(BaseModel):
+class DiscordAttachment(DiscordModel):
     """Discord 첨부파일 모델"""
     id: str = Field(..., description="첨부파일 ID")
     filename: str = Field(..., description="파일명")
@@ -137,14 +145,14 @@ class DiscordAttachment(BaseModel):
     ephemeral: bool = Field(False, description="임시 여부")
 
 
-class DiscordReaction(BaseModel):
+class DiscordReaction(DiscordModel):
     """Discord 리액션 모델"""
     count: int = Field(..., description="개수")
     me: bool = Field(False, description="내가 리액션했는지 여부")
     emoji: Dict[str, Any] = Field(..., description="이모지 정보")
 
 
-class DiscordMessage(BaseModel):
+class DiscordMessage(DiscordModel):
     """Discord 메시지 모델"""
     id: str = Field(..., description="메시지 ID")
     channel_id: str = Field(..., description="채널 ID")
@@ -156,7 +164,7 @@ class DiscordMessage(BaseModel):
     mention_everyone: bool = Field(False, description="모든 사용자 멘션 여부")
     mentions: List[DiscordUser] = Field(default_factory=list, description="멘션된 사용자 목록")
     mention_roles: List[str] = Field(default_factory=list, description="멘션된 역할 목록")
-    mention_channels: List[Dict[str, Any]] = Field(default_factory=list, description="멘션된 채널 목록")
+    mention_channels: list = Field(default_factory=list, description="멘션된 채널 목록")
     attachments: List[DiscordAttachment] = Field(default_factory=list, description="첨부파일 목록")
     embeds: List[DiscordEmbed] = Field(default_factory=list, description="임베드 목록")
     reactions: List[DiscordReaction] = Field(default_factory=list, description="리액션 목록")
@@ -164,28 +172,31 @@ class DiscordMessage(BaseModel):
     pinned: bool = Field(False, description="고정 여부")
     webhook_id: Optional[str] = Field(None, description="웹훅 ID")
     type: int = Field(0, description="메시지 타입")
-    activity: Optional[Dict[str, Any]] = Field(None, description="활동")
-    application: Optional[Dict[str, Any]] = Field(None, description="애플리케이션")
+    activity: Any = Field(None, description="활동")
+    application: Any = Field(None, description="애플리케이션")
     application_id: Optional[str] = Field(None, description="애플리케이션 ID")
-    message_reference: Optional[Dict[str, Any]] = Field(None, description="메시지 참조")
+    message_reference: Any = Field(None, description="메시지 참조")
     flags: int = Field(0, description="메시지 플래그")
-    referenced_message: Optional[Dict[str, Any]] = Field(None, description="참조된 메시지")
-    interaction: Optional[Dict[str, Any]] = Field(None, description="상호작용")
-    thread: Optional[Dict[str, Any]] = Field(None, description="스레드")
-    components: List[Dict[str, Any]] = Field(default_factory=list, description="컴포넌트 목록")
-    sticker_items: List[Dict[str, Any]] = Field(default_factory=list, description="스티커 아이템 목록")
-    stickers: List[Dict[str, Any]] = Field(default_factory=list, description="스티커 목록")
+    referenced_message: Any = Field(None, description="참조된 메시지")
+    interaction: Any = Field(None, description="상호작용")
+    thread: Any = Field(None, description="스레드")
+    components: list = Field(default_factory=list, description="컴포넌트 목록")
+    sticker_items: list = Field(default_factory=list, description="스티커 아이템 목록")
+    stickers: list = Field(default_factory=list, description="스티커 목록")
     position: Optional[int] = Field(None, description="위치")
 
 
-class DiscordThread(BaseModel):
+class DiscordThread(DiscordModel):
     """Discord 스레드 모델"""
+    # 자주 쓰이지 않으므로 검증기는 첫 사용 시 생성
+    model_config = ConfigDict(defer_build=True)
+    
     id: str = Field(..., description="스레드 ID")
     name: str = Field(..., description="스레드 이름")
     type: int = Field(..., description="스레드 타입")
     guild_id: str = Field(..., description="길드 ID")
     position: Optional[int] = Field(None, description="위치")
-    permission_overwrites: List[Dict[str, Any]] = Field(default_factory=list, description="권한 덮어쓰기")
+    permission_overwrites: list = Field(default_factory=list, description="권한 덮어쓰기")
     rate_limit_per_user: Optional[int] = Field(None, description="사용자당 속도 제한")
     owner_id: Optional[str] = Field(None, description="소유자 ID")
     last_message_id: Optional[str] = Field(None, description="마지막 메시지 ID")
@@ -198,8 +209,11 @@ class DiscordThread(BaseModel):
     flags: int = Field(0, description="스레드 플래그")
 
 
-class DiscordRole(BaseModel):
+class DiscordRole(DiscordModel):
     """Discord 역할 모델"""
+    # 자주 쓰이지 않으므로 검증기는 첫 사용 시 생성
+    model_config = ConfigDict(defer_build=True)
+    
     id: str = Field(..., description="역할 ID")
     name: str = Field(..., description="역할 이름")
     color: int = Field(0, description="색상")
@@ -214,8 +228,11 @@ class DiscordRole(BaseModel):
     flags: int = Field(0, description="역할 플래그")
 
 
-class DiscordWebhook(BaseModel):
+class DiscordWebhook(DiscordModel):
     """Discord 웹훅 모델"""
+    # 자주 쓰이지 않으므로 검증기는 첫 사용 시 생성
+    model_config = ConfigDict(defer_build=True)
+    
     id: str = Field(..., description="웹훅 ID")
     type: int = Field(..., description="웹훅 타입")
     guild_id: Optional[str] = Field(None, description="길드 ID")
@@ -231,7 +248,7 @@ class DiscordWebhook(BaseModel):
 
 
 # 채널 타입 상수
-class ChannelType:
+class ChannelType(IntEnum):
     GUILD_TEXT = 0
     DM = 1
     GUILD_VOICE = 2
@@ -247,7 +264,7 @@ class ChannelType:
 
 
 # 메시지 타입 상수
-class MessageType:
+class MessageType(IntEnum):
     DEFAULT = 0
     RECIPIENT_ADD = 1
     RECIPIENT_REMOVE = 2
@@ -1,39 +1,162 @@
 """
 Redis 기반 캐싱
 """
-import json
 import hashlib
-from typing import Any, Optional, Dict, Union
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Dict, List, Sequence, Tuple, Union
+import orjson
 import redis.asyncio as redis
 from loguru import logger
 
 from .schema import ErrorCode, MCPError
 
 
+class _NullPipeline:
+    """Redis 미연결 시 사용하는 no-op 파이프라인"""
+    
+    def __getattr__(self, name: str):
+        # setex/sadd/expire/smembers 등은 아무것도 쌓지 않음
+        return lambda *args, **kwargs: self
+    
+    async def execute(self) -> List[Any]:
+        return []
+    
+    async def __aenter__(self) -> "_NullPipeline":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+class _NullRedis:
+    """Redis 미연결 시 사용하는 no-op 백엔드 (연결 여부 분기 없이 호출 가능)"""
+    
+    async def get(self, key: str) -> None:
+        return None
+    
+    async def mget(self, keys: Sequence[str]) -> List[None]:
+        return [None] * len(keys)
+    
+    async def setex(self, key: str, ttl: int, value: bytes) -> bool:
+        return False
+    
+    async def delete(self, *keys: str) -> int:
+        return 0
+    
+    async def keys(self, pattern: str) -> List[bytes]:
+        return []
+    
+    async def exists(self, *keys: str) -> int:
+        return 0
+    
+    async def smembers(self, key: str) -> set:
+        return set()
+    
+    def pipeline(self, transaction: bool = True) -> _NullPipeline:
+        return _NullPipeline()
+    
+    async def close(self) -> None:
+        return None
+
+
+_NULL_REDIS = _NullRedis()
+
+
+class LocalTTLCache:
+    """프로세스 내 LRU + TTL 캐시 (Redis 앞단 L1)
+    
+    값은 직렬화된 bytes로 보관하고 조회할 때마다 새로 디코딩하므로
+    호출 측이 받은 dict를 수정해도 캐시나 다른 호출 측에 영향이 없음
+    무효화는 현재 프로세스에만 적용되므로 다른 프로세스/레플리카는 최대 ttl초 동안 이전 값을 볼 수 있음
+    """
+    
+    def __init__(self, maxsize: int = 10_000, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # 키 -> (만료 시각, 직렬화된 값, 그룹)
+        self._data: "OrderedDict[str, Tuple[float, bytes, Optional[str]]]" = OrderedDict()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """값 가져오기 (만료된 항목은 제거, 매번 새 객체로 디코딩)"""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        
+        expires_at, value, _ = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        
+        self._data.move_to_end(key)
+        return orjson.loads(value)
+    
+    def set(self, key: str, value: bytes, group: Optional[str] = None) -> None:
+        """직렬화된 값 저장 (group은 pop_group으로 한 번에 지울 단위, 최대 크기를 넘으면 LRU 제거)"""
+        self._data[key] = (time.monotonic() + self.ttl, value, group)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: str) -> None:
+        """값 제거"""
+        self._data.pop(key, None)
+    
+    def pop_group(self, group: str) -> None:
+        """같은 그룹의 값 모두 제거 (만료 여부와 관계없이)"""
+        keys = [key for key, (_, _, item_group) in self._data.items() if item_group == group]
+        for key in keys:
+            del self._data[key]
+
+
 class CacheManager:
     """캐시 관리자"""
     
-    def __init__(self, redis_url: str = "redis://localhost:6379", ttl: int = 300):
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        ttl: int = 300,
+        max_connections: Optional[int] = None
+    ):
         self.redis_url = redis_url
         self.ttl = ttl
-        self._redis: Optional[redis.Redis] = None
+        # 커넥션 풀 크기 (동시 코루틴 수가 많으면 redis-py 기본값으로는 부족)
+        self.max_connections = (
+            max_connections
+            if max_connections is not None
+            else int(os.getenv("REDIS_MAX_CONNECTIONS", "64"))
+        )
+        # 인덱스 SET TTL (등록되는 개별 키의 TTL보다 길게 유지)
+        self.index_ttl = 3600
+        self._redis: Union[redis.Redis, _NullRedis] = _NULL_REDIS
         self._connected = False
     
     async def connect(self) -> None:
         """Redis 연결"""
+        client = redis.from_url(
+            self.redis_url,
+            max_connections=self.max_connections,
+            decode_responses=False,  # bytes 그대로 orjson에 전달
+            socket_keepalive=True,
+            health_check_interval=30
+        )
         try:
-            self._redis = redis.from_url(self.redis_url)
-            await self._redis.ping()
+            await client.ping()
+            self._redis = client
             self._connected = True
             logger.info("Connected to Redis cache")
         except Exception as e:
             logger.warning(f"Failed to connect to Redis: {e}")
+            await client.close()
+            self._redis = _NULL_REDIS
             self._connected = False
     
     async def disconnect(self) -> None:
         """Redis 연결 해제"""
-        if self._redis:
+        if self._connected:
             await self._redis.close()
+            self._redis = _NULL_REDIS
             self._connected = False
             logger.info("Disconnected from Redis cache")
     
@@ -42,62 +165,101 @@ class CacheManager:
         key_parts = [prefix, identifier]
         if params:
             # 파라미터를 정렬하여 일관된 키 생성
-            sorted_params = sorted(params.items())
-            param_str = json.dumps(sorted_params, sort_keys=True)
-            param_hash = hashlib.md5(param_str.encode()).hexdigest()[:8]
+            param_str = "|".join(f"{k}={v}" for k, v in sorted(params.items()))
+            param_hash = hashlib.blake2b(param_str.encode(), digest_size=4).hexdigest()
             key_parts.append(param_hash)
         return ":".join(key_parts)
     
     async def get(self, key: str) -> Optional[Any]:
         """캐시에서 값 가져오기"""
-        if not self._connected or not self._redis:
-            return None
-        
         try:
             value = await self._redis.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
         except Exception as e:
             logger.warning(f"Failed to get cache value: {e}")
         
         return None
     
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """여러 키를 MGET 한 번으로 가져오기 (없는 키는 None)"""
+        return [
+            orjson.loads(value) if value else None
+            for value in await self.get_raw_many(keys)
+        ]
+    
+    async def get_raw_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """여러 키의 직렬화된 값(bytes)을 MGET 한 번으로 가져오기"""
+        if not keys:
+            return [None] * len(keys)
+        
+        try:
+            return await self._redis.mget(keys)
+        except Exception as e:
+            logger.warning(f"Failed to get cache values: {e}")
+            return [None] * len(keys)
+    
+    async def _setex(self, key: str, ttl: int, value: bytes, indexes: Sequence[str]) -> bool:
+        """값 저장 (인덱스 SET이 주어지면 같은 파이프라인에서 키를 등록)"""
+        if not indexes:
+            return bool(await self._redis.setex(key, ttl, value))
+        
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.setex(key, ttl, value)
+            for index in indexes:
+                pipe.sadd(index, key)
+                pipe.expire(index, self.index_ttl)
+            results = await pipe.execute()
+        return bool(results) and bool(results[0])
+    
     async def set(
         self,
         key: str,
         value: Any,
-        ttl: Optional[int] = None
+        ttl: Optional[int] = None,
+        indexes: Sequence[str] = ()
     ) -> bool:
         """캐시에 값 저장"""
-        if not self._connected or not self._redis:
-            return False
-        
         try:
             ttl = ttl or self.ttl
-            serialized_value = json.dumps(value, ensure_ascii=False)
-            await self._redis.setex(key, ttl, serialized_value)
-            return True
+            serialized_value = orjson.dumps(value)
+            return await self._setex(key, ttl, serialized_value, indexes)
         except Exception as e:
             logger.warning(f"Failed to set cache value: {e}")
             return False
     
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        """캐시에서 직렬화된 값(bytes)을 그대로 가져오기"""
+        try:
+            return await self._redis.get(key)
+        except Exception as e:
+            logger.warning(f"Failed to get raw cache value: {e}")
+            return None
+    
+    async def set_raw(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[int] = None,
+        indexes: Sequence[str] = ()
+    ) -> bool:
+        """이미 직렬화된 값(bytes)을 그대로 캐시에 저장"""
+        try:
+            return await self._setex(key, ttl or self.ttl, value, indexes)
+        except Exception as e:
+            logger.warning(f"Failed to set raw cache value: {e}")
+            return False
+    
     async def delete(self, key: str) -> bool:
         """캐시에서 값 삭제"""
-        if not self._connected or not self._redis:
-            return False
-        
         try:
-            await self._redis.delete(key)
-            return True
+            return bool(await self._redis.delete(key))
         except Exception as e:
             logger.warning(f"Failed to delete cache value: {e}")
             return False
     
     async def delete_pattern(self, pattern: str) -> int:
         """패턴에 맞는 키들 삭제"""
-        if not self._connected or not self._redis:
-            return 0
-        
         try:
             keys = await self._redis.keys(pattern)
             if keys:
@@ -107,13 +269,30 @@ class CacheManager:
             logger.warning(f"Failed to delete cache pattern: {e}")
             return 0
     
+    async def delete_indexed(self, indexes: Sequence[str], keys: Sequence[str] = ()) -> int:
+        """인덱스 SET들에 등록된 키와 인덱스 자체를 삭제 (KEYS 스캔 없이 관련 키만)
+        
+        모든 인덱스의 SMEMBERS를 한 파이프라인으로 조회한 뒤 DEL 한 번으로 삭제 (2회 왕복)
+        """
+        if not indexes:
+            return 0
+        
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for index in indexes:
+                    pipe.smembers(index)
+                member_sets = await pipe.execute()
+            
+            members = set().union(*member_sets)
+            return await self._redis.delete(*members, *keys, *indexes)
+        except Exception as e:
+            logger.warning(f"Failed to delete indexed cache keys: {e}")
+            return 0
+    
     async def exists(self, key: str) -> bool:
         """키 존재 여부 확인"""
-        if not self._connected or not self._redis:
-            return False
-        
         try:
-            return await self._redis.exists(key)
+            return bool(await self._redis.exists(key))
         except Exception as e:
             logger.warning(f"Failed to check cache existence: {e}")
             return False
@@ -150,87 +329,187 @@ class CacheManager:
 class DiscordCache:
     """Discord API 캐시"""
     
+    # 캐시 키 접두사
+    GUILD_PREFIX = "discord:guild"
+    CHANNEL_PREFIX = "discord:channel"
+    MESSAGE_PREFIX = "discord:message"
+    USER_PREFIX = "discord:user"
+    ROLE_PREFIX = "discord:role"
+    INDEX_PREFIX = "discord:idx"
+    
     def __init__(self, cache_manager: CacheManager):
         self.cache = cache_manager
-        self.prefixes = {
-            "guild": "discord:guild",
-            "channel": "discord:channel",
-            "message": "discord:message",
-            "user": "discord:user",
-            "role": "discord:role",
-        }
+        # 자주 읽고 거의 바뀌지 않는 길드/채널 정보용 L1 캐시 (TTL 30초)
+        # 무효화는 이 프로세스의 L1과 Redis만 지우므로, 다른 레플리카의 L1은 TTL까지 이전 값을 반환할 수 있음
+        self._local_guilds = LocalTTLCache()
+        # 채널은 길드 ID를 그룹으로 저장 (invalidate_guild에서 한 번에 제거)
+        self._local_channels = LocalTTLCache()
+    
+    def _guild_key(self, guild_id: str) -> str:
+        """길드 정보 캐시 키 (파라미터가 없으므로 _generate_key를 거치지 않음)"""
+        return f"{self.GUILD_PREFIX}:{guild_id}"
+    
+    def _channel_key(self, channel_id: str) -> str:
+        """채널 정보 캐시 키 (파라미터가 없으므로 _generate_key를 거치지 않음)"""
+        return f"{self.CHANNEL_PREFIX}:{channel_id}"
+    
+    def _index(self, scope: str, identifier: str) -> str:
+        """무효화 범위별 인덱스 SET 키"""
+        return f"{self.INDEX_PREFIX}:{scope}:{identifier}"
+    
+    @staticmethod
+    def _fill_local(local: LocalTTLCache, key: str, raw: Optional[bytes]) -> Optional[Dict]:
+        """Redis에서 가져온 값을 디코딩하고 L1에 채움 (그룹은 값의 guild_id)"""
+        if not raw:
+            return None
+        value = orjson.loads(raw)
+        local.set(key, raw, value.get("guild_id") if isinstance(value, dict) else None)
+        return value
+    
+    async def _get_cached(self, local: LocalTTLCache, key: str) -> Optional[Dict]:
+        """L1 캐시를 먼저 확인하고, 없으면 Redis에서 가져와 L1에 채움"""
+        value = local.get(key)
+        if value is None:
+            try:
+                value = self._fill_local(local, key, await self.cache.get_raw(key))
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"Failed to get cache value: {e}")
+        return value
+    
+    async def _get_many_cached(self, local: LocalTTLCache, keys: List[str]) -> List[Optional[Dict]]:
+        """여러 키를 L1에서 먼저 찾고, 나머지만 MGET으로 가져오기"""
+        values = [local.get(key) for key in keys]
+        misses = [i for i, value in enumerate(values) if value is None]
+        if misses:
+            fetched = await self.cache.get_raw_many([keys[i] for i in misses])
+            for i, raw in zip(misses, fetched):
+                try:
+                    values[i] = self._fill_local(local, keys[i], raw)
+                except orjson.JSONDecodeError as e:
+                    logger.warning(f"Failed to get cache values: {e}")
+        return values
+    
+    async def _set_cached(
+        self,
+        local: LocalTTLCache,
+        key: str,
+        value: Dict,
+        ttl: int,
+        indexes: Sequence[str]
+    ) -> bool:
+        """한 번 직렬화해 L1과 Redis에 저장 (L1은 호출 측 dict와 분리됨)"""
+        try:
+            raw = orjson.dumps(value)
+        except TypeError as e:
+            logger.warning(f"Failed to set cache value: {e}")
+            return False
+        local.set(key, raw, value.get("guild_id"))
+        return await self.cache.set_raw(key, raw, ttl, indexes=indexes)
     
     async def get_guild(self, guild_id: str) -> Optional[Dict]:
         """길드 정보 캐시에서 가져오기"""
-        key = self.cache._generate_key(self.prefixes["guild"], guild_id)
-        return await self.cache.get(key)
+        return await self._get_cached(self._local_guilds, self._guild_key(guild_id))
+    
+    async def get_guilds(self, guild_ids: Sequence[str]) -> List[Optional[Dict]]:
+        """여러 길드 정보를 한 번에 캐시에서 가져오기"""
+        return await self._get_many_cached(
+            self._local_guilds, [self._guild_key(guild_id) for guild_id in guild_ids]
+        )
     
     async def set_guild(self, guild_id: str, guild_data: Dict, ttl: int = 300) -> bool:
         """길드 정보 캐시에 저장"""
-        key = self.cache._generate_key(self.prefixes["guild"], guild_id)
-        return await self.cache.set(key, guild_data, ttl)
+        return await self._set_cached(
+            self._local_guilds,
+            self._guild_key(guild_id),
+            guild_data,
+            ttl,
+            (self._index("guild", guild_id),)
+        )
     
     async def get_channel(self, channel_id: str) -> Optional[Dict]:
         """채널 정보 캐시에서 가져오기"""
-        key = self.cache._generate_key(self.prefixes["channel"], channel_id)
-        return await self.cache.get(key)
+        return await self._get_cached(self._local_channels, self._channel_key(channel_id))
+    
+    async def get_channels(self, channel_ids: Sequence[str]) -> List[Optional[Dict]]:
+        """여러 채널 정보를 한 번에 캐시에서 가져오기"""
+        return await self._get_many_cached(
+            self._local_channels, [self._channel_key(channel_id) for channel_id in channel_ids]
+        )
     
     async def set_channel(self, channel_id: str, channel_data: Dict, ttl: int = 300) -> bool:
         """채널 정보 캐시에 저장"""
-        key = self.cache._generate_key(self.prefixes["channel"], channel_id)
-        return await self.cache.set(key, channel_data, ttl)
+        indexes = [self._index("channel", channel_id)]
+        guild_id = channel_data.get("guild_id")
+        if guild_id:
+            indexes.append(self._index("guild", guild_id))
+        return await self._set_cached(
+            self._local_channels,
+            self._channel_key(channel_id),
+            channel_data,
+            ttl,
+            indexes
+        )
+    
+    def _messages_key(self, channel_id: str, limit: int, after: Optional[str]) -> str:
+        """메시지 목록 캐시 키 (파라미터가 고정되어 있으므로 해시 없이 바로 구성)"""
+        return f"{self.MESSAGE_PREFIX}:list:{channel_id}:{limit}:{after or '_'}"
     
     async def get_messages(
         self,
         channel_id: str,
         limit: int,
         after: Optional[str] = None
-    ) -> Optional[Dict]:
-        """메시지 목록 캐시에서 가져오기"""
-        params = {"limit": limit, "after": after}
-        key = self.cache._generate_key(
-            f"{self.prefixes['message']}:list",
-            channel_id,
-            params
-        )
-        return await self.cache.get(key)
+    ) -> Optional[bytes]:
+        """메시지 목록 캐시에서 가져오기 (Discord 응답 JSON bytes)"""
+        return await self.cache.get_raw(self._messages_key(channel_id, limit, after))
+    
+    async def get_messages_batch(
+        self,
+        specs: Sequence[Tuple[str, int, Optional[str]]]
+    ) -> List[Optional[bytes]]:
+        """여러 메시지 목록을 MGET 한 번으로 캐시에서 가져오기 (spec: (channel_id, limit, after))"""
+        return await self.cache.get_raw_many([self._messages_key(*spec) for spec in specs])
     
     async def set_messages(
         self,
         channel_id: str,
-        messages_data: Dict,
+        messages_data: bytes,
         limit: int,
         after: Optional[str] = None,
         ttl: int = 60
     ) -> bool:
-        """메시지 목록 캐시에 저장"""
-        params = {"limit": limit, "after": after}
-        key = self.cache._generate_key(
-            f"{self.prefixes['message']}:list",
-            channel_id,
-            params
+        """메시지 목록 캐시에 저장 (Discord 응답 JSON bytes를 재직렬화 없이 저장)"""
+        return await self.cache.set_raw(
+            self._messages_key(channel_id, limit, after),
+            messages_data,
+            ttl,
+            indexes=(self._index("channel", channel_id),)
         )
-        return await self.cache.set(key, messages_data, ttl)
     
     async def invalidate_channel(self, channel_id: str) -> None:
-        """채널 관련 캐시 무효화"""
-        patterns = [
-            f"{self.prefixes['channel']}:{channel_id}",
-            f"{self.prefixes['message']}:list:{channel_id}:*",
-        ]
+        """채널 관련 캐시 무효화 (채널 정보 + 메시지 목록)"""
+        await self.invalidate_channels([channel_id])
+    
+    async def invalidate_channels(self, channel_ids: Sequence[str]) -> None:
+        """여러 채널의 캐시를 한 번에 무효화"""
+        channel_keys = [self._channel_key(channel_id) for channel_id in channel_ids]
+        for key in channel_keys:
+            self._local_channels.pop(key)
         
-        for pattern in patterns:
-            await self.cache.delete_pattern(pattern)
+        await self.cache.delete_indexed(
+            [self._index("channel", channel_id) for channel_id in channel_ids],
+            channel_keys
+        )
     
     async def invalidate_guild(self, guild_id: str) -> None:
-        """길드 관련 캐시 무효화"""
-        patterns = [
-            f"{self.prefixes['guild']}:{guild_id}",
-            f"{self.prefixes['channel']}:*",  # 모든 채널 캐시 무효화
-        ]
+        """길드 관련 캐시 무효화 (길드 정보 + 해당 길드의 채널 정보)"""
+        self._local_guilds.pop(self._guild_key(guild_id))
+        self._local_channels.pop_group(guild_id)
         
-        for pattern in patterns:
-            await self.cache.delete_pattern(pattern)
+        await self.cache.delete_indexed(
+            [self._index("guild", guild_id)],
+            [self._guild_key(guild_id)]
+        )
 
 
 # 전역 캐시 인스턴스
@@ -2,15 +2,21 @@
 헬스체크 및 메트릭
 """
 import time
-from typing import Dict, Any, Optional
+from collections import deque
+from typing import Deque, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
+import orjson
 from loguru import logger
 
 from .cache import cache_manager
 from .schema import ErrorCode, MCPError
 
 
-@dataclass
+# 평균 지연시간 이동 평균 가중치
+_LATENCY_EMA_ALPHA = 0.1
+
+
+@dataclass(slots=True)
 class HealthStatus:
     """헬스 상태"""
     status: str
@@ -20,7 +26,7 @@ class HealthStatus:
     metrics: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceMetrics:
     """서비스 메트릭"""
     total_requests: int = 0
@@ -28,15 +34,20 @@ class ServiceMetrics:
     failed_requests: int = 0
     rate_limited_requests: int = 0
     average_latency: float = 0.0
-    last_request_time: Optional[float] = None
+    last_request_time: Optional[int] = None  # time.monotonic_ns()
 
 
 class HealthChecker:
     """헬스체크 관리자"""
     
     def __init__(self):
-        self.start_time = time.time()
+        self.start_time = time.monotonic_ns()
         self.metrics = ServiceMetrics()
+        # 최근 요청 지연시간 (백분위 계산용 고정 크기 링 버퍼)
+        self._latencies: Deque[float] = deque(maxlen=4096)
+        # 직렬화된 메트릭 캐시 (생성 시각 monotonic_ns, JSON bytes)
+        self._metrics_cache: Tuple[int, bytes] = (0, b"")
+        self.metrics_cache_ns = 500_000_000
         self._discord_connected = False
         self._redis_connected = False
     
@@ -56,7 +67,7 @@ class HealthChecker:
     ) -> None:
         """요청 메트릭 기록"""
         self.metrics.total_requests += 1
-        self.metrics.last_request_time = time.time()
+        self.metrics.last_request_time = time.monotonic_ns()
         
         if success:
             self.metrics.successful_requests += 1
@@ -66,14 +77,26 @@ class HealthChecker:
         if rate_limited:
             self.metrics.rate_limited_requests += 1
         
+        self._latencies.append(latency)
+        
         # 평균 지연시간 업데이트 (이동 평균)
         if self.metrics.average_latency == 0:
             self.metrics.average_latency = latency
         else:
-            alpha = 0.1  # 가중치
-            self.metrics.average_latency = (
-                alpha * latency + (1 - alpha) * self.metrics.average_latency
-            )
+            self.metrics.average_latency += _LATENCY_EMA_ALPHA * (latency - self.metrics.average_latency)
+    
+    def get_latency_percentiles(self) -> Dict[str, float]:
+        """최근 요청 지연시간 백분위 (초)"""
+        if not self._latencies:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        
+        samples = sorted(self._latencies)
+        last = len(samples) - 1
+        return {
+            "p50": samples[round(last * 0.50)],
+            "p95": samples[round(last * 0.95)],
+            "p99": samples[round(last * 0.99)],
+        }
     
     async def check_discord_health(self) -> Dict[str, Any]:
         """Discord API 헬스체크"""
@@ -123,7 +146,7 @@ class HealthChecker:
     async def get_health_status(self) -> HealthStatus:
         """전체 헬스 상태 반환"""
         current_time = time.time()
-        uptime = current_time - self.start_time
+        uptime = (time.monotonic_ns() - self.start_time) / 1e9
         
         # 서비스별 헬스체크
         discord_health = await self.check_discord_health()
@@ -143,6 +166,7 @@ class HealthChecker:
         status = "healthy" if all_healthy else "unhealthy"
         
         # 메트릭 정보
+        percentiles = self.get_latency_percentiles()
         metrics = {
             "total_requests": self.metrics.total_requests,
             "successful_requests": self.metrics.successful_requests,
@@ -152,6 +176,9 @@ class HealthChecker:
                 self.metrics.successful_requests / max(self.metrics.total_requests, 1)
             ),
             "average_latency_ms": self.metrics.average_latency * 1000,
+            "latency_p50_ms": percentiles["p50"] * 1000,
+            "latency_p95_ms": percentiles["p95"] * 1000,
+            "latency_p99_ms": percentiles["p99"] * 1000,
             "uptime_seconds": uptime,
         }
         
@@ -165,8 +192,8 @@ class HealthChecker:
     
     def get_metrics(self) -> Dict[str, Any]:
         """Prometheus 형식 메트릭 반환"""
-        current_time = time.time()
-        uptime = current_time - self.start_time
+        uptime = (time.monotonic_ns() - self.start_time) / 1e9
+        percentiles = self.get_latency_percentiles()
         
         return {
             "discord_mcp_requests_total": self.metrics.total_requests,
@@ -174,10 +201,24 @@ class HealthChecker:
             "discord_mcp_requests_failed": self.metrics.failed_requests,
             "discord_mcp_requests_rate_limited": self.metrics.rate_limited_requests,
             "discord_mcp_request_duration_seconds": self.metrics.average_latency,
+            "discord_mcp_request_duration_p50_seconds": percentiles["p50"],
+            "discord_mcp_request_duration_p95_seconds": percentiles["p95"],
+            "discord_mcp_request_duration_p99_seconds": percentiles["p99"],
             "discord_mcp_uptime_seconds": uptime,
             "discord_mcp_discord_connected": 1 if self._discord_connected else 0,
             "discord_mcp_redis_connected": 1 if self._redis_connected else 0,
         }
+    
+    def get_metrics_json(self) -> bytes:
+        """메트릭을 JSON bytes로 반환 (스크레이프 간격보다 짧은 시간 동안 재사용)"""
+        now = time.monotonic_ns()
+        cached_at, payload = self._metrics_cache
+        if payload and now - cached_at < self.metrics_cache_ns:
+            return payload
+        
+        payload = orjson.dumps(self.get_metrics())
+        self._metrics_cache = (now, payload)
+        return payload
 
 
 # 전역 헬스체커 인스턴스
@@ -199,3 +240,8 @@ async def get_health() -> Dict[str, Any]:
 async def get_metrics() -> Dict[str, Any]:
     """메트릭 엔드포인트용"""
     return health_checker.get_metrics()
+
+
+async def get_metrics_json() -> bytes:
+    """메트릭 엔드포인트용 (직렬화된 JSON)"""
+    return health_checker.get_metrics_json()
@@ -1,11 +1,17 @@
 """
 구조화 로깅 설정 (JSON 포맷)
 """
-import json
+import atexit
+import glob
+import queue
 import sys
 import os
-import uuid
-from typing import Any, Dict, Optional
+import struct
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+import orjson
 from loguru import logger
 from contextvars import ContextVar
 
@@ -14,12 +20,37 @@ request_id_var: ContextVar[Optional[str]] = ContextVar('request_id', default=Non
 tool_name_var: ContextVar[Optional[str]] = ContextVar('tool_name', default=None)
 channel_id_var: ContextVar[Optional[str]] = ContextVar('channel_id', default=None)
 
+# 포맷터 핫패스용 바운드 메서드
+_get_request_id = request_id_var.get
+_get_tool_name = tool_name_var.get
+_get_channel_id = channel_id_var.get
+
+# 요청 ID용 난수 풀 (urandom 한 번에 256개 분량)
+_UUID_POOL_SIZE = 16 * 256
+_uuid_pool = iter(())
+
+
+def _fast_uuid4() -> str:
+    """str(uuid.uuid4())와 같은 형식의 UUIDv4 (풀에서 16바이트씩 소비)"""
+    global _uuid_pool
+    try:
+        (raw,) = next(_uuid_pool)
+    except StopIteration:
+        _uuid_pool = struct.iter_unpack("16s", os.urandom(_UUID_POOL_SIZE))
+        (raw,) = next(_uuid_pool)
+    
+    raw = bytearray(raw)
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
 
 def get_request_id() -> str:
     """현재 요청 ID를 가져오거나 새로 생성"""
     request_id = request_id_var.get()
     if not request_id:
-        request_id = str(uuid.uuid4())
+        request_id = _fast_uuid4()
         request_id_var.set(request_id)
     return request_id
 
@@ -48,48 +79,268 @@ def clear_request_context() -> None:
 class JSONFormatter:
     """JSON 포맷터"""
     
-    def format(self, record: Dict[str, Any]) -> str:
-        """레코드를 JSON으로 포맷"""
-        # 기본 필드
+    def base_fields(
+        self,
+        timestamp: datetime,
+        level: str,
+        message: str,
+        module: Optional[str],
+        function: str,
+        line: int
+    ) -> Dict[str, Any]:
+        """기본 필드 + 요청 컨텍스트 (loguru 레코드와 직접 기록하는 로그 헬퍼가 공유)"""
         log_data = {
-            "timestamp": record["time"].isoformat(),
-            "level": record["level"].name,
-            "message": record["message"],
-            "module": record["name"],
-            "function": record["function"],
-            "line": record["line"],
+            "timestamp": timestamp.isoformat(),
+            "level": level,
+            "message": message,
+            "module": module,
+            "function": function,
+            "line": line,
         }
         
-        # 요청 컨텍스트 추가
-        request_id = request_id_var.get()
-        if request_id:
-            log_data["request_id"] = request_id
-            
-        tool_name = tool_name_var.get()
-        if tool_name:
-            log_data["tool"] = tool_name
-            
-        channel_id = channel_id_var.get()
-        if channel_id:
-            log_data["channel_id"] = channel_id
+        # 요청 컨텍스트 추가 (모두 비어 있으면 건너뜀)
+        request_id = _get_request_id()
+        tool_name = _get_tool_name()
+        channel_id = _get_channel_id()
+        if request_id or tool_name or channel_id:
+            if request_id:
+                log_data["request_id"] = request_id
+            if tool_name:
+                log_data["tool"] = tool_name
+            if channel_id:
+                log_data["channel_id"] = channel_id
+        
+        return log_data
+    
+    def format(self, record: Dict[str, Any]) -> str:
+        """레코드를 JSON으로 포맷"""
+        # 콘솔/파일 핸들러가 같은 레코드를 공유하므로 한 번만 직렬화
+        if "json" in record:
+            return "{json}\n"
+        
+        log_data = self.base_fields(
+            record["time"],
+            record["level"].name,
+            record["message"],
+            record["name"],
+            record["function"],
+            record["line"]
+        )
         
         # 추가 필드들
-        extra = record.get("extra", {})
-        for key, value in extra.items():
-            log_data[key] = value
+        extra = record["extra"]
+        if extra:
+            log_data.update(extra)
             
-        return json.dumps(log_data, ensure_ascii=False)
+        # loguru는 포맷 콜백의 반환값을 템플릿으로 다시 해석하므로
+        # 직렬화 결과는 레코드에 담고 고정 템플릿만 반환
+        record["json"] = orjson.dumps(
+            log_data, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+        return "{json}\n"
+
+
+# 모든 핸들러가 공유하는 포맷터
+_FORMATTER = JSONFormatter()
+
+# writev가 없는 플랫폼(Windows)에서는 join 후 write
+_HAS_WRITEV = hasattr(os, "writev")
+
+
+class LogFileWriter:
+    """JSON 로그 파일 writer (백그라운드 스레드에서 배치 기록 + 일 단위 로테이션 + 보관 기간 정리)
+    
+    loguru 파일 싱크와 _write_json_record가 같은 writer를 공유하며,
+    호출 측은 큐에 넣고 바로 반환 (디스크 I/O와 로테이션은 이벤트 루프 밖에서 처리)
+    큐가 가득 차면(디스크가 느린 경우) 메모리를 늘리지 않고 라인을 버리며,
+    기록/로테이션 실패와 버린 라인은 writer 스레드에서 종류별로 한 번만 WARNING으로 알림
+    (싱크 안에서 다시 로그를 남기지 않도록 호출 측은 개수만 셈)
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        rotation_seconds: float = 86400.0,
+        retention_seconds: float = 30 * 86400.0,
+        batch_size: int = 32,
+        max_queue_size: int = 10000
+    ):
+        self.path = path
+        self.rotation_seconds = rotation_seconds
+        self.retention_seconds = retention_seconds
+        # writev 한 번에 모을 최대 라인 수 (너무 크면 지연이 튐)
+        self.batch_size = batch_size
+        # 기록하지 못하고 버린 라인 수
+        self.dropped = 0
+        self._overflowed = False
+        self._fd = -1
+        self._rotate_at = 0.0
+        self._reported: Set[str] = set()
+        self._open()
+        
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(
+            target=self._run, name="discord-mcp-log-writer", daemon=True
+        )
+        self._thread.start()
+    
+    def _report(self, kind: str, error: Any) -> None:
+        """실패 종류별로 한 번만 경고 (경고 자체가 다시 이 writer로 들어와도 반복하지 않음)"""
+        if kind in self._reported:
+            return
+        self._reported.add(kind)
+        logger.warning(
+            "Log file writer degraded",
+            path=self.path,
+            kind=kind,
+            error=str(error)
+        )
+    
+    def _open(self) -> None:
+        """파일 열기 (append)"""
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._rotate_at = time.time() + self.rotation_seconds
+    
+    def _rotate(self) -> None:
+        """현재 파일을 타임스탬프 이름으로 옮기고 오래된 파일 정리"""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        root, ext = os.path.splitext(self.path)
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+        try:
+            os.replace(self.path, f"{root}.{stamp}{ext}")
+        except OSError as e:
+            self._report("rotate", e)
+        
+        cutoff = time.time() - self.retention_seconds
+        for old in glob.glob(f"{glob.escape(root)}.*{ext}"):
+            try:
+                if os.stat(old).st_mtime < cutoff:
+                    os.remove(old)
+            except OSError as e:
+                self._report("retention", e)
+        
+        self._open()
+    
+    def _write_batch(self, batch: List[bytes]) -> None:
+        """여러 라인을 시스템 콜 한 번으로 기록 (한 줄이면 write)"""
+        if self._fd < 0 or time.time() >= self._rotate_at:
+            self._rotate()
+        
+        if len(batch) == 1 or not _HAS_WRITEV:
+            data = batch[0] if len(batch) == 1 else b"".join(batch)
+        else:
+            written = os.writev(self._fd, batch)
+            total = sum(map(len, batch))
+            if written == total:
+                return
+            data = b"".join(batch)[written:]
+        
+        # 부분 기록된 나머지
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
+    
+    def _run(self) -> None:
+        """큐에 쌓인 라인을 batch_size 단위로 모아 기록 (None은 종료 신호)"""
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        batch_size = self.batch_size
+        while True:
+            data = get()
+            batch: List[bytes] = []
+            while data is not None:
+                batch.append(data)
+                if len(batch) >= batch_size:
+                    break
+                try:
+                    data = get_nowait()
+                except queue.Empty:
+                    break
+            
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except OSError as e:
+                    self.dropped += len(batch)
+                    self._report("write", e)
+            if self._overflowed and "queue_full" not in self._reported:
+                self._report("queue_full", f"{self.dropped} lines dropped")
+            if data is None:
+                if self._fd >= 0:
+                    os.close(self._fd)
+                    self._fd = -1
+                return
+    
+    def write_bytes(self, data: bytes) -> None:
+        """직렬화된 로그 라인을 기록 큐에 추가 (가득 차면 버림)"""
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            self.dropped += 1
+            self._overflowed = True
+    
+    def write(self, message: str) -> None:
+        """loguru 싱크 인터페이스"""
+        self.write_bytes(message.encode())
+    
+    def close(self) -> None:
+        """남은 로그를 모두 기록하고 스레드 종료"""
+        if self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=5)
+            except queue.Full:
+                return
+            self._thread.join(timeout=5)
+
+
+# 레벨 이름 -> 번호 (loguru 기본 레벨과 동일)
+_LEVEL_NOS = {
+    "TRACE": 5,
+    "DEBUG": 10,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+_LEVEL_INFO = _LEVEL_NOS["INFO"]
+_LEVEL_WARNING = _LEVEL_NOS["WARNING"]
+_LEVEL_ERROR = _LEVEL_NOS["ERROR"]
+
+# setup_logging 호출 여부 (import 시점이 아닌 앱 시작 시 설정)
+_configured = False
+# 직접 기록하는 로그 헬퍼(log_tool_call 등)가 사용하는 최소 레벨과 출력 대상
+_min_level_no = _LEVEL_NOS["INFO"]
+_STDOUT_FD = 1
+_file_writer: Optional[LogFileWriter] = None
+
+
+def _close_file_writer() -> None:
+    """종료 시 파일 버퍼 flush"""
+    if _file_writer is not None:
+        _file_writer.close()
+
+
+atexit.register(_close_file_writer)
 
 
 def setup_logging(log_level: str = "INFO") -> None:
     """로깅 설정"""
+    global _configured, _min_level_no, _file_writer
+    _configured = True
+    _min_level_no = logger.level(log_level).no
+    
     # 기존 핸들러 제거
     logger.remove()
+    _close_file_writer()
+    _file_writer = None
     
     # JSON 포맷터로 콘솔 출력
     logger.add(
         sys.stdout,
-        format=JSONFormatter().format,
+        format=_FORMATTER.format,
         level=log_level,
         serialize=False,
     )
@@ -119,12 +370,12 @@ def setup_logging(log_level: str = "INFO") -> None:
                     log_file = None
         
         if log_file:
+            # 1일 로테이션, 30일 보관
+            _file_writer = LogFileWriter(log_file)
             logger.add(
-                log_file,
-                format=JSONFormatter().format,
+                _file_writer.write,
+                format=_FORMATTER.format,
                 level=log_level,
-                rotation="1 day",
-                retention="30 days",
                 serialize=False,
             )
     except (OSError, PermissionError) as e:
@@ -132,6 +383,49 @@ def setup_logging(log_level: str = "INFO") -> None:
         logger.debug(f"File logging disabled: {e}")
 
 
+def _emit(level: str, message: str, fields: Dict[str, Any]) -> None:
+    """로그 헬퍼 공통 출력 (레벨 확인은 호출 측에서 끝낸 상태)
+    
+    setup_logging 이후에는 JSONFormatter와 같은 레코드를 직접 직렬화해 기록하고,
+    설정 전에는 loguru에 넘겨 현재 핸들러를 따름 (import/테스트 시 stdout에 쓰지 않음)
+    """
+    frame = sys._getframe(1)
+    if not _configured:
+        logger.opt(depth=1).log(level, message, **fields)
+        return
+    
+    log_data = _FORMATTER.base_fields(
+        datetime.now().astimezone(),
+        level,
+        message,
+        frame.f_globals.get("__name__"),
+        frame.f_code.co_name,
+        frame.f_lineno
+    )
+    log_data.update(fields)
+    _write_json_record(log_data)
+
+
+def _write_json_record(log_data: Dict[str, Any]) -> None:
+    """레코드를 한 번 직렬화해 stdout(fd)과 로그 파일 writer에 기록"""
+    line = orjson.dumps(
+        log_data,
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    )
+    os.write(_STDOUT_FD, line)
+    
+    file_writer = _file_writer
+    if file_writer is not None:
+        file_writer.write_bytes(line)
+
+
+def ensure_logging(log_level: str = "INFO") -> None:
+    """로깅이 아직 설정되지 않았을 때만 설정 (여러 번 호출해도 안전)"""
+    if not _configured:
+        setup_logging(log_level)
+
+
 def log_tool_call(
     tool_name: str,
     channel_id: Optional[str] = None,
@@ -143,6 +437,16 @@ def log_tool_call(
     **kwargs
 ) -> None:
     """툴 호출 로그"""
+    # 레벨 미달이면 레코드를 만들기 전에 종료
+    if success:
+        if _min_level_no > _LEVEL_INFO:
+            return
+        level, message = "INFO", "Tool call completed"
+    else:
+        if _min_level_no > _LEVEL_ERROR:
+            return
+        level, message = "ERROR", "Tool call failed"
+    
     log_data = {
         "tool": tool_name,
         "success": success,
@@ -164,12 +468,10 @@ def log_tool_call(
         log_data["error_message"] = error_message
         
     # 추가 필드들
-    log_data.update(kwargs)
+    if kwargs:
+        log_data.update(kwargs)
     
-    if success:
-        logger.info("Tool call completed", **log_data)
-    else:
-        logger.error("Tool call failed", **log_data)
+    _emit(level, message, log_data)
 
 
 def log_discord_api_call(
@@ -181,6 +483,20 @@ def log_discord_api_call(
     **kwargs
 ) -> None:
     """Discord API 호출 로그"""
+    if 200 <= status_code < 300:
+        # 응답마다 호출되므로 레벨 미달이면 레코드를 만들기 전에 종료
+        if _min_level_no > _LEVEL_INFO:
+            return
+        level, message = "INFO", "Discord API call successful"
+    elif status_code == 429:
+        if _min_level_no > _LEVEL_WARNING:
+            return
+        level, message = "WARNING", "Discord API rate limited"
+    else:
+        if _min_level_no > _LEVEL_ERROR:
+            return
+        level, message = "ERROR", "Discord API call failed"
+    
     log_data = {
         "method": method,
         "endpoint": endpoint,
@@ -191,15 +507,7 @@ def log_discord_api_call(
     if rate_limit_remaining is not None:
         log_data["rate_limit_remaining"] = rate_limit_remaining
         
-    log_data.update(kwargs)
+    if kwargs:
+        log_data.update(kwargs)
     
-    if 200 <= status_code < 300:
-        logger.info("Discord API call successful", **log_data)
-    elif status_code == 429:
-        logger.warning("Discord API rate limited", **log_data)
-    else:
-        logger.error("Discord API call failed", **log_data)
-
-
-# 로깅 초기화
-setup_logging()
+    _emit(level, message, log_data)
@@ -2,194 +2,297 @@
 Rate limit 관리
 """
 import asyncio
+import functools
+import re
 import time
-from typing import Dict, Optional, Tuple
+from typing import Dict, Mapping, Optional, Tuple
 from dataclasses import dataclass
 from loguru import logger
 
 from .schema import ErrorCode, MCPError
 
 
-@dataclass
+# 버킷 계산 시 유지하는 주요 파라미터 (channel/guild/webhook ID), 그 외 ID는 라우트 템플릿화
+_MAJOR_PARAM_RE = re.compile(r"^/(?:channels|guilds|webhooks)/(\d+)")
+_MINOR_ID_RE = re.compile(r"(?<!/channels/)(?<!/guilds/)(?<!/webhooks/)(?<=/)\d+")
+
+# 엔드포인트 -> 추정 버킷 (앞선 항목이 우선)
+_BUCKET_PATTERNS = (
+    ("guilds", "guilds"),
+    ("channels", "channels"),
+    ("messages", "messages"),
+    ("reactions", "reactions"),
+    ("webhooks", "webhooks"),
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _route_for(method: str, endpoint: str) -> str:
+    """요청 라우트 키 (주요 파라미터 외의 ID는 :id로 치환)"""
+    return f"{method} {_MINOR_ID_RE.sub(':id', endpoint)}"
+
+
+@dataclass(slots=True)
 class RateLimitInfo:
     """Rate limit 정보"""
     remaining: int
-    reset_after: float
+    reset_at: float  # 윈도우 리셋 시각 (time.monotonic 기준 절대값)
     bucket: Optional[str] = None
     global_limit: bool = False
+    limit: int = 1
 
 
 class RateLimiter:
     """Rate limit 관리자"""
     
-    def __init__(self):
+    def __init__(self, sweep_threshold: int = 1024):
+        # 버킷 키에 채널/길드 ID가 포함되므로 윈도우가 지난 버킷은 주기적으로 정리
         self._buckets: Dict[str, RateLimitInfo] = {}
+        self._sweep_threshold = sweep_threshold
+        self._sweep_at = sweep_threshold
         self._global_limit: Optional[RateLimitInfo] = None
+        # 대기 중인 버킷에만 락이 존재 (락을 잡았거나 기다리는 호출이 없으면 정리)
         self._locks: Dict[str, asyncio.Lock] = {}
-    
-    def _get_lock(self, bucket: str) -> asyncio.Lock:
-        """버킷별 락 가져오기"""
-        if bucket not in self._locks:
-            self._locks[bucket] = asyncio.Lock()
-        return self._locks[bucket]
+        # 버킷별 락 사용자 수 (보유 + 대기)
+        self._lock_users: Dict[str, int] = {}
     
     def update_rate_limit(
         self,
         bucket: str,
         remaining: int,
         reset_after: float,
-        is_global: bool = False
+        is_global: bool = False,
+        limit: int = 1,
+        reset_at: Optional[float] = None
     ) -> None:
-        """Rate limit 정보 업데이트"""
-        rate_limit_info = RateLimitInfo(
-            remaining=remaining,
-            reset_after=reset_after,
-            bucket=bucket,
-            global_limit=is_global
-        )
+        """Rate limit 정보 업데이트 (reset_at이 주어지면 reset_after 대신 사용)"""
+        now = time.monotonic()
+        if reset_at is None:
+            reset_at = now + reset_after
+        rate_limit_info = self._global_limit if is_global else self._buckets.get(bucket)
         
-        if is_global:
-            self._global_limit = rate_limit_info
+        if rate_limit_info is not None:
+            # 응답마다 새 객체를 만들지 않고 기존 상태를 갱신
+            rate_limit_info.remaining = remaining
+            rate_limit_info.reset_at = reset_at
+            rate_limit_info.bucket = bucket
+            rate_limit_info.limit = limit
         else:
-            self._buckets[bucket] = rate_limit_info
+            rate_limit_info = RateLimitInfo(
+                remaining=remaining,
+                reset_at=reset_at,
+                bucket=bucket,
+                global_limit=is_global,
+                limit=limit
+            )
+            if is_global:
+                self._global_limit = rate_limit_info
+            else:
+                if len(self._buckets) >= self._sweep_at:
+                    self._sweep_expired(now)
+                self._buckets[bucket] = rate_limit_info
         
         logger.debug(
             "Rate limit updated",
             bucket=bucket,
             remaining=remaining,
-            reset_after=reset_after,
+            reset_at=reset_at,
             is_global=is_global
         )
     
+    def _sweep_expired(self, now: float) -> None:
+        """윈도우가 지난 버킷 제거 (다음 정리 기준은 남은 수의 2배, 추가 비용은 분할 상환 O(1))
+        
+        리셋된 버킷은 토큰이 다시 찼으므로 상태가 없는 버킷(바로 통과)과 같음
+        """
+        expired = [bucket for bucket, info in self._buckets.items() if info.reset_at <= now]
+        for bucket in expired:
+            del self._buckets[bucket]
+        self._sweep_at = max(self._sweep_threshold, 2 * len(self._buckets))
+    
+    def acquire(self, bucket: str) -> float:
+        """요청 토큰 차감 (단일 이벤트 루프 전제, 락 없이 O(1))
+        
+        토큰이 있으면 하나를 차감하고 0을 반환하며,
+        없으면 차감하지 않고 윈도우 리셋까지 남은 시간(초)을 반환
+        """
+        now = time.monotonic()
+        
+        # 글로벌 rate limit 확인
+        global_limit = self._global_limit
+        if global_limit and global_limit.remaining <= 0:
+            wait_time = global_limit.reset_at - now
+            if wait_time > 0:
+                return wait_time
+            self._global_limit = None
+        
+        # 버킷별 토큰 확인
+        rate_limit_info = self._buckets.get(bucket)
+        if rate_limit_info is None:
+            return 0.0
+        
+        if rate_limit_info.remaining > 0:
+            rate_limit_info.remaining -= 1
+            return 0.0
+        
+        wait_time = rate_limit_info.reset_at - now
+        if wait_time > 0:
+            return wait_time
+        
+        # 윈도우가 리셋됨: 다음 응답 헤더로 다시 동기화될 때까지 제거
+        del self._buckets[bucket]
+        return 0.0
+    
     async def wait_for_rate_limit(self, bucket: str) -> None:
-        """Rate limit 대기"""
-        async with self._get_lock(bucket):
-            # 글로벌 rate limit 확인
-            if self._global_limit and self._global_limit.remaining <= 0:
-                wait_time = self._global_limit.reset_after
-                logger.warning(
-                    "Global rate limit hit, waiting",
-                    wait_time=wait_time
-                )
-                await asyncio.sleep(wait_time)
-                self._global_limit = None
-            
-            # 버킷별 rate limit 확인
-            if bucket in self._buckets:
-                rate_limit_info = self._buckets[bucket]
-                if rate_limit_info.remaining <= 0:
-                    wait_time = rate_limit_info.reset_after
+        """Rate limit 대기 (토큰을 얻을 때까지)"""
+        lock = self._locks.get(bucket)
+        if lock is None:
+            lock = self._locks[bucket] = asyncio.Lock()
+        self._lock_users[bucket] = self._lock_users.get(bucket, 0) + 1
+        try:
+            async with lock:
+                while True:
+                    wait_time = self.acquire(bucket)
+                    if wait_time <= 0:
+                        return
                     logger.warning(
                         "Rate limit hit for bucket",
                         bucket=bucket,
                         wait_time=wait_time
                     )
                     await asyncio.sleep(wait_time)
-                    # 대기 후 제거
-                    del self._buckets[bucket]
+        finally:
+            # 버킷 키에 ID가 포함되므로 쉬는 락은 남기지 않음
+            # (release 직후 다음 대기자가 깨어나기 전에도 locked()는 False이므로 사용자 수로 판단)
+            users = self._lock_users[bucket] - 1
+            if users:
+                self._lock_users[bucket] = users
+            else:
+                del self._lock_users[bucket]
+                del self._locks[bucket]
     
     def is_rate_limited(self, bucket: str) -> bool:
         """Rate limit 상태 확인"""
         # 글로벌 rate limit 확인
-        if self._global_limit and self._global_limit.remaining <= 0:
+        global_limit = self._global_limit
+        if global_limit and global_limit.remaining <= 0:
             return True
         
         # 버킷별 rate limit 확인
-        if bucket in self._buckets:
-            rate_limit_info = self._buckets[bucket]
-            return rate_limit_info.remaining <= 0
-        
-        return False
+        rate_limit_info = self._buckets.get(bucket)
+        return rate_limit_info is not None and rate_limit_info.remaining <= 0
     
     def get_remaining_requests(self, bucket: str) -> int:
         """남은 요청 수 반환"""
-        if bucket in self._buckets:
-            return self._buckets[bucket].remaining
-        return 999  # 기본값
+        rate_limit_info = self._buckets.get(bucket)
+        return rate_limit_info.remaining if rate_limit_info else 999  # 기본값
     
     def get_reset_time(self, bucket: str) -> float:
-        """리셋 시간 반환"""
-        if bucket in self._buckets:
-            return self._buckets[bucket].reset_after
-        return 0.0
+        """리셋까지 남은 시간(초) 반환"""
+        rate_limit_info = self._buckets.get(bucket)
+        if rate_limit_info is None:
+            return 0.0
+        return max(0.0, rate_limit_info.reset_at - time.monotonic())
 
 
 class DiscordRateLimiter:
     """Discord API Rate Limiter"""
     
-    def __init__(self):
+    def __init__(self, max_routes: int = 4096):
         self.rate_limiter = RateLimiter()
-        self._bucket_patterns = {
-            "guilds": "guilds",
-            "channels": "channels",
-            "messages": "messages",
-            "reactions": "reactions",
-            "webhooks": "webhooks",
-        }
+        # 라우트 -> 실제 버킷 키 (X-RateLimit-Bucket 헤더로 학습, 최근 응답 순으로 max_routes개까지)
+        self._route_to_bucket: Dict[str, str] = {}
+        self._max_routes = max_routes
     
     def _get_bucket(self, endpoint: str) -> str:
         """엔드포인트에서 버킷 추출"""
-        for pattern, bucket in self._bucket_patterns.items():
-            if pattern in endpoint.lower():
+        endpoint = endpoint.lower()
+        for pattern, bucket in _BUCKET_PATTERNS:
+            if pattern in endpoint:
                 return bucket
         return "default"
     
+    def bucket_for(self, method: str, endpoint: str) -> str:
+        """요청에 적용할 버킷 (학습된 실제 버킷 우선, 처음 보는 라우트는 엔드포인트로 추정)"""
+        bucket = self._route_to_bucket.get(_route_for(method, endpoint))
+        if bucket is None:
+            return self._get_bucket(endpoint)
+        return bucket
+    
     def parse_rate_limit_headers(
         self,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
         endpoint: str
     ) -> Optional[RateLimitInfo]:
         """Rate limit 헤더 파싱"""
         try:
             remaining = int(headers.get("X-RateLimit-Remaining", "1"))
+            limit = int(headers.get("X-RateLimit-Limit", "1"))
             reset_after = float(headers.get("X-RateLimit-Reset-After", "0"))
             bucket = headers.get("X-RateLimit-Bucket", self._get_bucket(endpoint))
             is_global = headers.get("X-RateLimit-Global", "").lower() == "true"
             
             return RateLimitInfo(
                 remaining=remaining,
-                reset_after=reset_after,
+                reset_at=time.monotonic() + reset_after,
                 bucket=bucket,
-                global_limit=is_global
+                global_limit=is_global,
+                limit=limit
             )
         except (ValueError, TypeError) as e:
             logger.warning(f"Failed to parse rate limit headers: {e}")
             return None
     
-    async def handle_rate_limit(
+    def handle_rate_limit(
         self,
         endpoint: str,
-        headers: Dict[str, str]
+        headers: Mapping[str, str],
+        method: str = "GET"
     ) -> None:
-        """Rate limit 헤더 처리"""
+        """Rate limit 헤더로 버킷 상태 동기화 (aiohttp 응답 헤더를 복사 없이 그대로 받음)
+        
+        대기는 다음 요청의 check_rate_limit에서만 수행
+        """
         rate_limit_info = self.parse_rate_limit_headers(headers, endpoint)
         if not rate_limit_info:
             return
         
-        bucket = rate_limit_info.bucket or self._get_bucket(endpoint)
+        # 실제 버킷은 같은 주요 파라미터 안에서만 공유됨
+        header_bucket = headers.get("X-RateLimit-Bucket")
+        if header_bucket:
+            major = _MAJOR_PARAM_RE.match(endpoint)
+            bucket = f"{header_bucket}:{major.group(1) if major else ''}"
+            self._learn_route(_route_for(method, endpoint), bucket)
+        else:
+            bucket = self.bucket_for(method, endpoint)
         
         # Rate limit 정보 업데이트
         self.rate_limiter.update_rate_limit(
             bucket=bucket,
             remaining=rate_limit_info.remaining,
-            reset_after=rate_limit_info.reset_after,
-            is_global=rate_limit_info.global_limit
+            reset_after=0.0,
+            is_global=rate_limit_info.global_limit,
+            limit=rate_limit_info.limit,
+            reset_at=rate_limit_info.reset_at
         )
-        
-        # Rate limit 대기
-        if self.rate_limiter.is_rate_limited(bucket):
-            await self.rate_limiter.wait_for_rate_limit(bucket)
     
-    async def check_rate_limit(self, endpoint: str) -> None:
-        """Rate limit 확인 및 대기"""
-        bucket = self._get_bucket(endpoint)
+    def _learn_route(self, route: str, bucket: str) -> None:
+        """라우트 -> 버킷 매핑 갱신 (dict 삽입 순서를 LRU로 사용, 가장 오래된 라우트부터 제거)"""
+        routes = self._route_to_bucket
+        if routes.pop(route, None) is None and len(routes) >= self._max_routes:
+            del routes[next(iter(routes))]
+        routes[route] = bucket
+    
+    async def check_rate_limit(self, endpoint: str, method: str = "GET") -> None:
+        """Rate limit 확인: 토큰을 차감하고, 부족할 때만 대기"""
+        bucket = self.bucket_for(method, endpoint)
         
-        if self.rate_limiter.is_rate_limited(bucket):
+        if self.rate_limiter.acquire(bucket) > 0:
             await self.rate_limiter.wait_for_rate_limit(bucket)
     
-    def get_rate_limit_info(self, endpoint: str) -> Tuple[int, float]:
+    def get_rate_limit_info(self, endpoint: str, method: str = "GET") -> Tuple[int, float]:
         """Rate limit 정보 반환 (remaining, reset_time)"""
-        bucket = self._get_bucket(endpoint)
+        bucket = self.bucket_for(method, endpoint)
         remaining = self.rate_limiter.get_remaining_requests(bucket)
         reset_time = self.rate_limiter.get_reset_time(bucket)
         return remaining, reset_time
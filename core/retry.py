@@ -1,92 +1,31 @@
 """
-재시도 로직 (tenacity 기반)
+재시도 로직 (Discord API 에러 분류 + 지수 백오프)
 """
 import asyncio
-import random
-from typing import Any, Callable, Optional, Type, Union
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    before_sleep_log,
-    after_log,
-)
+from typing import Any, Callable, Optional
 from loguru import logger
 
 from .schema import ErrorCode, MCPError
 
 
-class RetryConfig:
-    """재시도 설정"""
-    def __init__(
-        self,
-        max_attempts: int = 3,
-        base_delay: float = 1.0,
-        max_delay: float = 60.0,
-        exponential_multiplier: float = 2.0,
-        jitter: bool = True,
-        retryable_exceptions: tuple = (Exception,)
-    ):
-        self.max_attempts = max_attempts
-        self.base_delay = base_delay
-        self.max_delay = max_delay
-        self.exponential_multiplier = exponential_multiplier
-        self.jitter = jitter
-        self.retryable_exceptions = retryable_exceptions
-
-
-# 기본 재시도 설정
-DEFAULT_RETRY_CONFIG = RetryConfig()
-
-
-def create_retry_decorator(config: RetryConfig = DEFAULT_RETRY_CONFIG):
-    """재시도 데코레이터 생성"""
+class DiscordAPIError(Exception):
+    """Discord API 에러 (kind로 종류 구분)"""
+    __slots__ = ("kind", "status_code", "retry_after", "rate_limited")
     
-    def wait_with_jitter(retry_state):
-        """지수 백오프 + jitter"""
-        attempt = retry_state.attempt_number
-        delay = config.base_delay * (config.exponential_multiplier ** (attempt - 1))
-        delay = min(delay, config.max_delay)
-        
-        if config.jitter:
-            # ±25% 랜덤 지연
-            jitter_range = delay * 0.25
-            delay += random.uniform(-jitter_range, jitter_range)
-            
-        return max(0, delay)
+    KIND_OTHER = 0
+    KIND_RATE_LIMIT = 1
+    KIND_TIMEOUT = 2
     
-    return retry(
-        stop=stop_after_attempt(config.max_attempts),
-        wait=wait_with_jitter,
-        retry=retry_if_exception_type(config.retryable_exceptions),
-        before_sleep=before_sleep_log(logger, "WARNING"),
-        after=after_log(logger, "INFO"),
-    )
-
-
-def retry_async(
-    func: Callable,
-    *args,
-    config: RetryConfig = DEFAULT_RETRY_CONFIG,
-    **kwargs
-) -> Any:
-    """비동기 함수 재시도 실행"""
-    retry_decorator = create_retry_decorator(config)
-    decorated_func = retry_decorator(func)
-    return decorated_func(*args, **kwargs)
-
-
-class DiscordAPIError(Exception):
-    """Discord API 에러"""
     def __init__(
         self,
         message: str,
         status_code: Optional[int] = None,
         retry_after: Optional[float] = None,
-        rate_limited: bool = False
+        rate_limited: bool = False,
+        kind: int = KIND_OTHER
     ):
         super().__init__(message)
+        self.kind = kind
         self.status_code = status_code
         self.retry_after = retry_after
         self.rate_limited = rate_limited
@@ -94,38 +33,47 @@ class DiscordAPIError(Exception):
 
 class RateLimitError(DiscordAPIError):
     """Rate limit 에러"""
+    __slots__ = ()
+    
     def __init__(self, message: str, retry_after: float):
-        super().__init__(message, status_code=429, retry_after=retry_after, rate_limited=True)
+        super().__init__(
+            message,
+            status_code=429,
+            retry_after=retry_after,
+            rate_limited=True,
+            kind=DiscordAPIError.KIND_RATE_LIMIT
+        )
 
 
 class TimeoutError(DiscordAPIError):
     """타임아웃 에러"""
+    __slots__ = ()
+    
     def __init__(self, message: str):
-        super().__init__(message, status_code=408)
+        super().__init__(message, status_code=408, kind=DiscordAPIError.KIND_TIMEOUT)
 
 
 def is_retryable_error(error: Exception) -> bool:
     """에러가 재시도 가능한지 확인"""
-    if isinstance(error, RateLimitError):
-        return True
-    if isinstance(error, TimeoutError):
-        return True
-    if isinstance(error, asyncio.TimeoutError):
-        return True
-    if isinstance(error, ConnectionError):
-        return True
-    return False
+    kind = getattr(error, "kind", None)
+    if kind is not None:
+        return kind != DiscordAPIError.KIND_OTHER
+    return isinstance(error, (asyncio.TimeoutError, ConnectionError))
+
+
+# 시도 횟수별 지수 백오프 지연 (1초부터 두 배씩, 최대 60초)
+_BACKOFF_DELAYS = tuple(min(1.0 * (2 ** i), 60.0) for i in range(7))
 
 
 def get_retry_delay(error: Exception, attempt: int) -> float:
     """에러에 따른 재시도 지연 시간 계산"""
-    if isinstance(error, RateLimitError) and error.retry_after:
+    if getattr(error, "kind", None) == DiscordAPIError.KIND_RATE_LIMIT and error.retry_after:
         return error.retry_after
     
     # 지수 백오프
-    base_delay = 1.0
-    delay = base_delay * (2 ** (attempt - 1))
-    return min(delay, 60.0)
+    if attempt <= len(_BACKOFF_DELAYS):
+        return _BACKOFF_DELAYS[attempt - 1]
+    return _BACKOFF_DELAYS[-1]
 
 
 async def retry_with_backoff(
@@ -162,14 +110,15 @@ async def retry_with_backoff(
             await asyncio.sleep(delay)
     
     # 모든 재시도 실패
-    if isinstance(last_error, RateLimitError):
+    kind = getattr(last_error, "kind", None)
+    if kind == DiscordAPIError.KIND_RATE_LIMIT:
         raise MCPError(
             code=ErrorCode.RATE_LIMITED,
             message="Discord API rate limit exceeded",
             retry_after_ms=int(last_error.retry_after * 1000) if last_error.retry_after else None,
             rate_limited=True
         )
-    elif isinstance(last_error, TimeoutError):
+    elif kind == DiscordAPIError.KIND_TIMEOUT:
         raise MCPError(
             code=ErrorCode.TIMEOUT_ERROR,
             message="Request timeout",
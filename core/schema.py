@@ -1,8 +1,10 @@
 """
 Pydantic 모델 및 JSON Schema 정의
 """
+import functools
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from enum import Enum
 
 
@@ -20,7 +22,34 @@ class ErrorCode(int, Enum):
     TIMEOUT_ERROR = 1002
 
 
-class MCPError(BaseModel):
+class MCPError(Exception):
+    """MCP 에러 (raise 가능한 경량 예외, 생성 시 검증 없음)"""
+    __slots__ = ("code", "message", "retry_after_ms", "rate_limited")
+    
+    def __init__(
+        self,
+        code: ErrorCode,
+        message: str,
+        retry_after_ms: Optional[int] = None,
+        rate_limited: bool = False
+    ):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.retry_after_ms = retry_after_ms
+        self.rate_limited = rate_limited
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """응답용 딕셔너리 (MCPErrorInfo 형태)"""
+        return {
+            "code": self.code,
+            "message": self.message,
+            "retry_after_ms": self.retry_after_ms,
+            "rate_limited": self.rate_limited,
+        }
+
+
+class MCPErrorInfo(BaseModel):
     """MCP 에러 응답 모델"""
     code: ErrorCode = Field(..., description="에러 코드")
     message: str = Field(..., description="에러 메시지")
@@ -32,7 +61,7 @@ class MCPResponse(BaseModel):
     """MCP 응답 기본 모델"""
     success: bool = Field(..., description="성공 여부")
     data: Optional[Any] = Field(None, description="응답 데이터")
-    error: Optional[MCPError] = Field(None, description="에러 정보")
+    error: Optional[MCPErrorInfo] = Field(None, description="에러 정보")
 
 
 class ToolDefinition(BaseModel):
@@ -145,18 +174,24 @@ class DiscordRole(BaseModel):
 
 
 # 툴별 입력/출력 스키마
-def create_json_schema(model: type[BaseModel]) -> Dict[str, Any]:
-    """Pydantic 모델을 JSON Schema로 변환"""
-    return model.model_json_schema()
-
-
-# 공통 스키마
-COMMON_SCHEMAS = {
-    "error": create_json_schema(MCPError),
+@functools.lru_cache(maxsize=None)
+def create_json_schema(model: Any) -> Dict[str, Any]:
+    """Pydantic 모델 또는 타입(Dict[str, Any] 등)을 JSON Schema로 변환
+    
+    타입별로 한 번만 생성하고 같은 dict를 공유하므로 반환값을 수정하지 말 것
+    """
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return model.model_json_schema()
+    return TypeAdapter(model).json_schema()
+
+
+# 공통 스키마 (읽기 전용)
+COMMON_SCHEMAS = MappingProxyType({
+    "error": create_json_schema(MCPErrorInfo),
     "response": create_json_schema(MCPResponse),
     "tool_definition": create_json_schema(ToolDefinition),
     "list_tools_request": create_json_schema(ListToolsRequest),
     "list_tools_response": create_json_schema(ListToolsResponse),
     "call_tool_request": create_json_schema(CallToolRequest),
     "call_tool_response": create_json_schema(CallToolResponse),
-}
+})
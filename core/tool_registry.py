@@ -1,30 +1,93 @@
 """
 MCP 툴 등록 시스템
 """
-from typing import Any, Callable, Dict, List, Optional, Type
+import functools
+import re
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 from dataclasses import dataclass
+import orjson
 from loguru import logger
 
 from .schema import ToolDefinition, MCPError, ErrorCode
 
 
-@dataclass
+# 생성 검증 함수가 해석하지 않는 스키마 키워드 (있으면 범용 검증 사용)
+_UNSUPPORTED_KEYWORDS = frozenset(("$ref", "anyOf", "oneOf", "allOf", "not", "if"))
+_MISSING = object()
+# 생성된 검증 함수의 파일명 구분용 (트레이스백 가독성)
+_validator_seq = 0
+# get_tool에서 없는 이름 조회용 (호출마다 빈 dict를 만들지 않음)
+_EMPTY: Dict[str, Any] = {}
+# "v1", "v1.2", "1.2.3" 형태의 버전 (앞의 v는 생략 가능)
+_VERSION_RE = re.compile(r"^v?(\d+)(?:\.(\d+))?(?:\.(\d+))?")
+
+
+@functools.lru_cache(maxsize=256)
+def _version_key(version: str) -> Tuple[Tuple[int, ...], str]:
+    """버전 비교 키 ((major, minor, patch), 원본 문자열)
+    
+    숫자 단위로 비교해 "v10" > "v2", 형식이 다른 버전은 숫자 버전보다 낮게 취급
+    """
+    match = _VERSION_RE.match(version)
+    if match is None:
+        return (), version
+    return tuple(int(part or 0) for part in match.groups()), version
+
+
+# 툴 출력으로 허용하는 타입 (정확한 타입은 집합 조회, 하위 클래스는 isinstance)
+_VALID_OUTPUT_TYPES = (dict, list, str, int, float, bool, type(None))
+_VALID_OUTPUT_CLASSES = frozenset(_VALID_OUTPUT_TYPES)
+# JSON Schema 타입 -> 검사 함수 (bool은 int의 하위 클래스이므로 integer/number에서 제외)
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: not isinstance(v, bool) and isinstance(v, (int, float)),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+}
+# 같은 규칙의 Python 타입 (생성 검증 함수에 isinstance로 인라인, 알 수 없는 타입은 검사하지 않음)
+_TYPE_CLASSES: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+@dataclass(slots=True)
 class ToolHandler:
-    """툴 핸들러"""
+    """툴 핸들러 (슬롯 사용: 동적 속성 추가 불가, 필드는 모두 여기에 선언)"""
     name: str
     handler: Callable
     input_schema: Dict[str, Any]
     output_schema: Dict[str, Any]
     description: str
     version: str = "v1"
+    # 등록 시 input_schema로부터 미리 만든 입력 검증 함수
+    input_validator: Optional[Callable[[Dict[str, Any]], None]] = None
+    # ToolDefinition(...).model_dump()와 같은 형태의 정의 (list_tools 응답용)
+    definition_dict: Optional[Dict[str, Any]] = None
+    # get_tool_info 응답 (같은 이름의 버전 목록이 바뀌면 다시 생성)
+    info_dict: Optional[Dict[str, Any]] = None
 
 
 class ToolRegistry:
     """MCP 툴 레지스트리"""
     
     def __init__(self):
-        self._tools: Dict[str, ToolHandler] = {}
+        # 이름 -> 버전 -> 핸들러 (조회 시 "name@version" 문자열을 만들지 않음)
+        self._tools: Dict[str, Dict[str, ToolHandler]] = {}
         self._tool_versions: Dict[str, List[str]] = {}
+        # 이름별 최신 버전 (등록/해제 시 갱신)
+        self._latest: Dict[str, str] = {}
+        # list_tools 결과 캐시 ((include_versions, as_dict)별, 등록/해제 시 무효화)
+        self._list_cache: Dict[Tuple[bool, bool], List[Any]] = {}
+        # /mcp/list_tools 응답 본문 (JSON bytes, 등록/해제 시 무효화)
+        self._list_tools_bytes: Optional[bytes] = None
     
     def register_tool(
         self,
@@ -36,12 +99,19 @@ class ToolRegistry:
         version: str = "v1"
     ) -> None:
         """툴 등록"""
+        # 키로 쓰는 이름/버전은 intern (등록된 키끼리는 포인터 비교로 끝남)
+        name = sys.intern(name)
+        version = sys.intern(version)
+        
         # 버전 관리
         if name not in self._tool_versions:
             self._tool_versions[name] = []
         
         if version not in self._tool_versions[name]:
             self._tool_versions[name].append(version)
+            latest = self._latest.get(name)
+            if latest is None or _version_key(version) > _version_key(latest):
+                self._latest[name] = version
         
         # 툴 핸들러 생성
         tool_handler = ToolHandler(
@@ -52,54 +122,96 @@ class ToolRegistry:
             description=description,
             version=version
         )
+        tool_handler.input_validator = self._compile_input_validator(input_schema)
+        tool_handler.definition_dict = {
+            "name": name,
+            "description": description,
+            "input_schema": input_schema,
+            "output_schema": output_schema,
+            "version": version,
+        }
         
-        # 툴 등록 (버전 포함 키 사용)
-        tool_key = f"{name}@{version}"
-        self._tools[tool_key] = tool_handler
+        # 툴 등록
+        self._tools.setdefault(name, {})[version] = tool_handler
+        self._list_cache.clear()
+        self._list_tools_bytes = None
+        self._refresh_tool_info(name)
         
-        logger.info(f"Registered tool: {tool_key}")
+        logger.info(f"Registered tool: {name}@{version}")
     
     def get_tool(self, name: str, version: Optional[str] = None) -> Optional[ToolHandler]:
         """툴 가져오기"""
-        if version:
-            tool_key = f"{name}@{version}"
-        else:
+        if not version:
             # 최신 버전 사용
-            if name in self._tool_versions:
-                latest_version = max(self._tool_versions[name])
-                tool_key = f"{name}@{latest_version}"
-            else:
+            version = self._latest.get(name)
+            if version is None:
                 return None
         
-        return self._tools.get(tool_key)
+        return self._tools.get(name, _EMPTY).get(version)
+    
+    def list_tools(self, include_versions: bool = False, as_dict: bool = False) -> List[Any]:
+        """등록된 툴 목록 반환 (등록 상태가 바뀔 때까지 캐시)
+        
+        as_dict=True면 ToolDefinition 대신 등록 시 만들어 둔 정의 dict를 반환
+        """
+        cache_key = (include_versions, as_dict)
+        cached = self._list_cache.get(cache_key)
+        if cached is None:
+            handlers = self._select_handlers(include_versions)
+            if as_dict:
+                cached = [tool_handler.definition_dict for tool_handler in handlers]
+            else:
+                cached = [
+                    ToolDefinition(
+                        name=tool_handler.name,
+                        description=tool_handler.description,
+                        input_schema=tool_handler.input_schema,
+                        output_schema=tool_handler.output_schema,
+                        version=tool_handler.version
+                    )
+                    for tool_handler in handlers
+                ]
+            self._list_cache[cache_key] = cached
+        return list(cached)
+    
+    def list_tools_as_dicts(self) -> List[Dict[str, Any]]:
+        """최신 버전 툴 정의 dict 목록 (HTTP 응답용, Pydantic 변환 없음)"""
+        return self.list_tools(as_dict=True)
     
-    def list_tools(self, include_versions: bool = False) -> List[ToolDefinition]:
-        """등록된 툴 목록 반환"""
-        tools = []
+    def list_tools_response_bytes(self) -> bytes:
+        """직렬화된 list_tools 응답 본문 (등록 상태가 바뀔 때까지 재사용)"""
+        body = self._list_tools_bytes
+        if body is None:
+            body = orjson.dumps({
+                "success": True,
+                "data": {"tools": self.list_tools_as_dicts()}
+            })
+            self._list_tools_bytes = body
+        return body
+    
+    def _select_handlers(self, include_versions: bool) -> List[ToolHandler]:
+        """목록에 포함할 핸들러 (이름순)"""
+        handlers = []
+        # 중복은 set으로 확인
+        latest = self._latest
+        seen = set()
         
-        for tool_handler in self._tools.values():
+        for tool_handler in (h for versions in self._tools.values() for h in versions.values()):
             # 중복 제거 (같은 이름의 최신 버전만)
             if not include_versions:
                 tool_name = tool_handler.name
-                if tool_name in [t.name for t in tools]:
+                if tool_name in seen:
                     continue
                 
                 # 최신 버전인지 확인
-                if tool_name in self._tool_versions:
-                    latest_version = max(self._tool_versions[tool_name])
-                    if tool_handler.version != latest_version:
-                        continue
+                latest_version = latest.get(tool_name)
+                if latest_version is not None and tool_handler.version != latest_version:
+                    continue
+                seen.add(tool_name)
             
-            tool_definition = ToolDefinition(
-                name=tool_handler.name,
-                description=tool_handler.description,
-                input_schema=tool_handler.input_schema,
-                output_schema=tool_handler.output_schema,
-                version=tool_handler.version
-            )
-            tools.append(tool_definition)
+            handlers.append(tool_handler)
         
-        return sorted(tools, key=lambda t: t.name)
+        return sorted(handlers, key=lambda h: h.name)
     
     def list_tool_versions(self, name: str) -> List[str]:
         """특정 툴의 버전 목록 반환"""
@@ -111,7 +223,7 @@ class ToolRegistry:
         params: Dict[str, Any],
         version: Optional[str] = None
     ) -> Any:
-        """툴 호출"""
+        """툴 호출 (MCPError가 아닌 예외도 그대로 전파)"""
         tool_handler = self.get_tool(name, version)
         if not tool_handler:
             raise MCPError(
@@ -119,116 +231,169 @@ class ToolRegistry:
                 message=f"Tool '{name}' not found"
             )
         
-        try:
-            # 입력 검증 (간단한 타입 체크)
-            self._validate_input(tool_handler.input_schema, params)
-            
-            # 툴 실행
-            if tool_handler.handler:
-                result = await tool_handler.handler(**params)
-            else:
-                raise MCPError(
-                    code=ErrorCode.INTERNAL_ERROR,
-                    message="Tool handler not available"
-                )
-            
-            # 출력 검증
-            self._validate_output(tool_handler.output_schema, result)
-            
-            return result
-            
-        except MCPError:
-            raise
-        except Exception as e:
-            logger.error(f"Tool execution failed: {e}", tool=name, params=params)
+        # 입력 검증 (등록 시 컴파일된 검증 함수)
+        tool_handler.input_validator(params)
+        
+        # 툴 실행 (예외는 감싸지 않고 그대로 전파, 로깅/변환은 호출 측에서 한 번만)
+        if tool_handler.handler:
+            result = await tool_handler.handler(**params)
+        else:
             raise MCPError(
                 code=ErrorCode.INTERNAL_ERROR,
-                message=f"Tool execution failed: {str(e)}"
+                message="Tool handler not available"
             )
+        
+        # 출력 검증
+        self._validate_output(tool_handler.output_schema, result)
+        
+        return result
+    
+    def _compile_input_validator(self, schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], None]:
+        """입력 스키마를 전용 검증 함수로 미리 변환 (호출마다 스키마를 탐색하지 않음)
+        
+        규칙(필수 필드 존재 + 알려진 타입의 isinstance 검사)을 필드별 직선 코드로 생성해
+        exec로 컴파일, 생성할 수 없는 스키마는 필드별 검사를 미리 풀어 둔 클로저 사용
+        """
+        try:
+            source, namespace = self._generate_validator_source(schema)
+        except (AttributeError, TypeError, ValueError):
+            source = None
+        
+        if source is None:
+            return self._specialize_input_validator(schema)
+        
+        global _validator_seq
+        _validator_seq += 1
+        exec(compile(source, f"<tool-validator-{_validator_seq}>", "exec"), namespace)
+        return namespace["validate"]
     
-    def _validate_input(self, schema: Dict[str, Any], params: Dict[str, Any]) -> None:
-        """입력 파라미터 검증"""
-        required_props = schema.get("properties", {})
-        required_fields = schema.get("required", [])
-        
-        # 필수 필드 확인
-        for field in required_fields:
-            if field not in params:
-                raise MCPError(
-                    code=ErrorCode.VALIDATION_ERROR,
-                    message=f"Missing required parameter: {field}"
-                )
-        
-        # 타입 검증 (간단한 버전)
-        for field, value in params.items():
-            if field in required_props:
-                expected_type = required_props[field].get("type")
-                if expected_type and not self._check_type(value, expected_type):
+    def _generate_validator_source(self, schema: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
+        """검증 함수 소스와 전역 네임스페이스 생성 (지원하지 않는 스키마면 소스 None)"""
+        if _UNSUPPORTED_KEYWORDS.intersection(schema):
+            return None, {}
+        properties = schema.get("properties", {})
+        if any(_UNSUPPORTED_KEYWORDS.intersection(prop) for prop in properties.values()):
+            return None, {}
+        
+        namespace: Dict[str, Any] = {
+            "MCPError": MCPError,
+            "VALIDATION_ERROR": ErrorCode.VALIDATION_ERROR,
+            "MISSING": _MISSING,
+        }
+        lines = ["def validate(params):"]
+        
+        for name in schema.get("required", ()):
+            if not isinstance(name, str):
+                raise TypeError("required field name must be a string")
+            message = f"Missing required parameter: {name}"
+            lines.append(f"    if {name!r} not in params:")
+            lines.append(f"        raise MCPError(code=VALIDATION_ERROR, message={message!r})")
+        
+        for index, (name, prop) in enumerate(properties.items()):
+            expected_type = prop.get("type")
+            py_type = _TYPE_CLASSES.get(expected_type) if isinstance(expected_type, str) else None
+            if py_type is None:
+                continue
+            namespace[f"T{index}"] = py_type
+            message = f"Invalid type for parameter '{name}': expected {expected_type}"
+            lines.append(f"    value = params.get({name!r}, MISSING)")
+            if expected_type in ("integer", "number"):
+                # _TYPE_CHECKS와 같이 bool은 integer/number로 인정하지 않음
+                lines.append(f"    if value is not MISSING and (not isinstance(value, T{index}) or value.__class__ is bool):")
+            else:
+                lines.append(f"    if value is not MISSING and not isinstance(value, T{index}):")
+            lines.append(f"        raise MCPError(code=VALIDATION_ERROR, message={message!r})")
+        
+        lines.append("    return None")
+        return "\n".join(lines) + "\n", namespace
+    
+    def _specialize_input_validator(self, schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], None]:
+        """같은 규칙을 스키마에 대해 부분 평가한 클로저 (코드 생성이 불가능한 스키마용)
+        
+        필수 필드 튜플과 (필드명, 검사 함수, 타입명) 튜플을 등록 시 한 번만 만들어
+        호출마다 스키마/타입 테이블을 조회하지 않음
+        """
+        required_fields = tuple(schema.get("required", ()))
+        checks = []
+        for name, prop in schema.get("properties", {}).items():
+            expected_type = prop.get("type") if isinstance(prop, dict) else None
+            check = _TYPE_CHECKS.get(expected_type) if isinstance(expected_type, str) else None
+            if check is not None:
+                checks.append((name, check, expected_type))
+        checks = tuple(checks)
+        
+        def validate(params: Dict[str, Any]) -> None:
+            for name in required_fields:
+                if name not in params:
                     raise MCPError(
                         code=ErrorCode.VALIDATION_ERROR,
-                        message=f"Invalid type for parameter '{field}': expected {expected_type}"
+                        message=f"Missing required parameter: {name}"
                     )
+            for name, check, expected_type in checks:
+                value = params.get(name, _MISSING)
+                if value is not _MISSING and not check(value):
+                    raise MCPError(
+                        code=ErrorCode.VALIDATION_ERROR,
+                        message=f"Invalid type for parameter '{name}': expected {expected_type}"
+                    )
+        
+        return validate
     
     def _validate_output(self, schema: Dict[str, Any], result: Any) -> None:
         """출력 결과 검증"""
         # 간단한 검증만 수행
-        if not isinstance(result, (dict, list, str, int, float, bool, type(None))):
+        if result.__class__ not in _VALID_OUTPUT_CLASSES and not isinstance(result, _VALID_OUTPUT_TYPES):
             raise MCPError(
                 code=ErrorCode.VALIDATION_ERROR,
                 message="Invalid output type from tool"
             )
     
-    def _check_type(self, value: Any, expected_type: str) -> bool:
-        """타입 체크"""
-        type_mapping = {
-            "string": str,
-            "integer": int,
-            "number": (int, float),
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
-        
-        if expected_type in type_mapping:
-            return isinstance(value, type_mapping[expected_type])
-        
-        return True  # 알 수 없는 타입은 통과
-    
     def get_tool_info(self, name: str, version: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """툴 정보 반환"""
         tool_handler = self.get_tool(name, version)
         if not tool_handler:
             return None
         
-        return {
-            "name": tool_handler.name,
-            "description": tool_handler.description,
-            "version": tool_handler.version,
-            "input_schema": tool_handler.input_schema,
-            "output_schema": tool_handler.output_schema,
-            "available_versions": self.list_tool_versions(name)
-        }
+        return tool_handler.info_dict
+    
+    def _refresh_tool_info(self, name: str) -> None:
+        """같은 이름의 모든 핸들러의 info_dict 재생성 (버전 목록 변경 시)"""
+        available_versions = list(self.list_tool_versions(name))
+        for tool_handler in self._tools.get(name, _EMPTY).values():
+            tool_handler.info_dict = {
+                "name": tool_handler.name,
+                "description": tool_handler.description,
+                "version": tool_handler.version,
+                "input_schema": tool_handler.input_schema,
+                "output_schema": tool_handler.output_schema,
+                "available_versions": available_versions
+            }
     
     def unregister_tool(self, name: str, version: Optional[str] = None) -> bool:
         """툴 등록 해제"""
+        self._list_cache.clear()
+        self._list_tools_bytes = None
         if version:
-            tool_key = f"{name}@{version}"
-            if tool_key in self._tools:
-                del self._tools[tool_key]
+            versions = self._tools.get(name)
+            if versions and version in versions:
+                del versions[version]
+                if not versions:
+                    del self._tools[name]
                 if name in self._tool_versions:
                     self._tool_versions[name].remove(version)
                     if not self._tool_versions[name]:
                         del self._tool_versions[name]
+                        self._latest.pop(name, None)
+                    elif self._latest.get(name) == version:
+                        self._latest[name] = max(self._tool_versions[name], key=_version_key)
+                self._refresh_tool_info(name)
                 return True
         else:
             # 모든 버전 제거
             if name in self._tool_versions:
-                versions = self._tool_versions[name].copy()
-                for v in versions:
-                    tool_key = f"{name}@{v}"
-                    if tool_key in self._tools:
-                        del self._tools[tool_key]
+                self._tools.pop(name, None)
                 del self._tool_versions[name]
+                self._latest.pop(name, None)
                 return True
         
         return False
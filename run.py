@@ -41,7 +41,10 @@ def main():
         host=host,
         port=port,
         log_level=log_level,
-        reload=os.getenv("ENVIRONMENT") == "development"
+        reload=os.getenv("ENVIRONMENT") == "development",
+        # uvloop (libuv 기반 이벤트 루프) + httptools 파서, Windows는 기본 asyncio 루프
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
 
 
@@ -1,38 +1,65 @@
 """
 Discord MCP Server - FastAPI 애플리케이션
 """
+import importlib
 import os
+import sys
 import asyncio
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from typing import Any, Dict
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from loguru import logger
 
 from .rpc import mcp_handler
 from ..core.tool_registry import tool_registry
 from ..core.cache import cache_manager
-from ..core.health import get_health, get_metrics
+from ..core.health import get_health, get_metrics_json
+from ..core.logging import ensure_logging
 from ..adapters.discord.http import DiscordClient
-from ..tools.discord.channels import register_channel_tools, set_discord_client as set_channel_client
-from ..tools.discord.messages import register_message_tools, set_discord_client as set_message_client
-from ..tools.discord.threads import register_thread_tools, set_discord_client as set_thread_client
-from ..tools.discord.reactions import register_reaction_tools, set_discord_client as set_reaction_client
-from ..tools.discord.roles import register_role_tools, set_discord_client as set_role_client
-from ..tools.discord.advanced import register_advanced_tools, set_discord_client as set_advanced_client
 
 
+# 툴 모듈 (tools.discord 하위 모듈명 -> 등록 함수명), 시작 시 필요한 것만 import
+_TOOL_MODULES = {
+    "channels": "register_channel_tools",
+    "messages": "register_message_tools",
+    "threads": "register_thread_tools",
+    "reactions": "register_reaction_tools",
+    "roles": "register_role_tools",
+    "advanced": "register_advanced_tools",
+}
+_DEFAULT_ENABLED_TOOLS = ",".join(_TOOL_MODULES)
+
 # 전역 Discord 클라이언트
 discord_client: DiscordClient = None
 
 
+def _load_tool_modules(client: DiscordClient) -> None:
+    """ENABLED_TOOLS에 지정된 툴 모듈만 import해 클라이언트 설정 후 등록"""
+    enabled = os.getenv("ENABLED_TOOLS", _DEFAULT_ENABLED_TOOLS)
+    for name in (part.strip() for part in enabled.split(",")):
+        if not name:
+            continue
+        register_name = _TOOL_MODULES.get(name)
+        if register_name is None:
+            logger.warning(f"Unknown tool module in ENABLED_TOOLS: {name}")
+            continue
+        
+        module = importlib.import_module(f"..tools.discord.{name}", package=__package__)
+        module.set_discord_client(client)
+        getattr(module, register_name)()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
     # 시작
+    ensure_logging()
     logger.info("Starting Discord MCP Server...")
     
     # 환경 변수 로드
@@ -45,21 +72,8 @@ async def lifespan(app: FastAPI):
     discord_client = DiscordClient(bot_token)
     await discord_client.connect()
     
-    # 툴 클라이언트 설정
-    set_channel_client(discord_client)
-    set_message_client(discord_client)
-    set_thread_client(discord_client)
-    set_reaction_client(discord_client)
-    set_role_client(discord_client)
-    set_advanced_client(discord_client)
-    
-    # 툴 등록
-    register_channel_tools()
-    register_message_tools()
-    register_thread_tools()
-    register_reaction_tools()
-    register_role_tools()
-    register_advanced_tools()
+    # 툴 클라이언트 설정 및 등록
+    _load_tool_modules(discord_client)
     
     # 캐시 연결
     await cache_manager.connect()
@@ -123,31 +137,54 @@ async def health_check():
 @app.get("/metrics")
 async def metrics():
     """메트릭 엔드포인트"""
-    return await get_metrics()
+    return Response(content=await get_metrics_json(), media_type="application/json")
 
 
 @app.post("/mcp/list_tools")
 async def list_tools():
     """MCP 툴 목록 조회"""
     try:
-        tools = tool_registry.list_tools()
-        return {
-            "success": True,
-            "data": {
-                "tools": [tool.model_dump() for tool in tools]
-            }
-        }
+        # 툴 목록은 등록 시에만 바뀌므로 미리 직렬화된 본문을 그대로 반환
+        return Response(content=tool_registry.list_tools_response_bytes(), media_type="application/json")
     except Exception as e:
         logger.error(f"Failed to list tools: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/mcp/call_tool")
-async def call_tool(request: MCPRequest):
-    """MCP 툴 호출"""
+def _parse_mcp_body(body: bytes) -> MCPRequest:
+    """요청 본문을 MCPRequest로 한 번에 파싱/검증 (pydantic-core가 JSON을 바로 읽음)
+    
+    검증 실패는 FastAPI 본문 검증과 같은 422 응답이 되도록 loc에 "body"를 붙여 전달
+    """
     try:
-        result = await mcp_handler.handle_request(request.method, request.params)
-        return result
+        return MCPRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = e.errors()
+    
+    if not body or errors[0]["type"] != "json_invalid":
+        # JSON 모드 메시지는 FastAPI 본문 검증(Python 모드)과 문구가 달라 실패 경로에서만 같은 방식으로 다시 검증
+        # (FastAPI는 빈 본문/null을 본문 누락으로 처리)
+        payload = orjson.loads(body) if body else None
+        if payload is None:
+            errors = ValidationError.from_exception_data(
+                MCPRequest.__name__, [{"type": "missing", "loc": (), "input": None}]
+            ).errors()
+        else:
+            try:
+                MCPRequest.model_validate(payload, from_attributes=True)
+            except ValidationError as e:
+                errors = e.errors()
+    
+    raise RequestValidationError(
+        [{**error, "loc": ("body", *error["loc"])} for error in errors],
+        body=body
+    )
+
+
+async def _handle_mcp(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """MCP 요청 처리 (HTTPException 외의 예외는 500으로 변환)"""
+    try:
+        return await mcp_handler.handle_request(method, params)
     except HTTPException:
         raise
     except Exception as e:
@@ -155,10 +192,25 @@ async def call_tool(request: MCPRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post(
+    "/mcp/call_tool",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": MCPRequest.model_json_schema()}},
+        }
+    },
+)
+async def call_tool(request: Request):
+    """MCP 툴 호출 (본문을 MCPRequest 모델 없이 직접 파싱, 응답은 orjson으로 직렬화)"""
+    mcp_request = _parse_mcp_body(await request.body())
+    return ORJSONResponse(content=await _handle_mcp(mcp_request.method, mcp_request.params))
+
+
 @app.post("/mcp")
 async def mcp_endpoint(request: MCPRequest):
     """일반적인 MCP 엔드포인트"""
-    return await call_tool(request)
+    return await _handle_mcp(request.method, request.params)
 
 
 # 에러 핸들러
@@ -205,5 +257,7 @@ if __name__ == "__main__":
         host=host,
         port=port,
         reload=True,
-        log_level="info"
+        log_level="info",
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
@@ -1,20 +1,26 @@
 """
 JSON-RPC 핸들러
 """
-import time
+import itertools
+import os
 from typing import Any, Dict, Optional
 from fastapi import HTTPException
 from loguru import logger
 
 from ..core.tool_registry import tool_registry
 from ..core.schema import (
-    MCPResponse, MCPError, ErrorCode, 
+    MCPError, ErrorCode,
     ListToolsRequest, ListToolsResponse,
     CallToolRequest, CallToolResponse
 )
 from ..core.logging import log_tool_call, set_request_context, clear_request_context
 
 
+# 요청 ID: 프로세스별 접두사 + 단조 증가 카운터 (요청마다 시계를 읽지 않음)
+_REQUEST_ID_PREFIX = f"req_{os.getpid()}_"
+_request_counter = itertools.count(1)
+
+
 class MCPHandler:
     """MCP 요청 핸들러"""
     
@@ -29,7 +35,7 @@ class MCPHandler:
     
     async def handle_call_tool(self, request: CallToolRequest) -> CallToolResponse:
         """툴 호출"""
-        request_id = f"req_{int(time.time() * 1000)}"
+        request_id = _REQUEST_ID_PREFIX + str(next(_request_counter))
         set_request_context(request_id=request_id, tool_name=request.tool)
         
         try:
@@ -42,42 +48,35 @@ class MCPHandler:
             log_tool_call(request.tool, success=True)
             return CallToolResponse(result=result)
             
+        except MCPError as e:
+            log_tool_call(request.tool, success=False, error_message=e.message, params=request.params)
+            raise HTTPException(status_code=400, detail=e.to_dict())
         except Exception as e:
-            logger.error(f"Tool execution failed: {e}", tool=request.tool, params=request.params)
-            log_tool_call(request.tool, success=False, error_message=str(e))
-            
-            # MCP 에러로 변환
-            if isinstance(e, MCPError):
-                raise HTTPException(
-                    status_code=400,
-                    detail={
-                        "code": e.code,
-                        "message": e.message,
-                        "retry_after_ms": e.retry_after_ms,
-                        "rate_limited": e.rate_limited
-                    }
-                )
-            else:
-                raise HTTPException(
-                    status_code=500,
-                    detail={
-                        "code": ErrorCode.INTERNAL_ERROR,
-                        "message": f"Internal server error: {str(e)}"
-                    }
-                )
+            # 툴 실행 중 예외: 이 지점에서만 로깅하고 MCP 에러 형태로 한 번 변환
+            message = f"Tool execution failed: {e}"
+            log_tool_call(request.tool, success=False, error_message=message, params=request.params)
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "code": ErrorCode.INTERNAL_ERROR,
+                    "message": message,
+                    "retry_after_ms": None,
+                    "rate_limited": False
+                }
+            )
         finally:
             clear_request_context()
     
     async def handle_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """일반적인 MCP 요청 처리"""
+        """일반적인 MCP 요청 처리
+        
+        응답은 MCPResponse(...).model_dump()와 같은 형태의 dict를 직접 구성
+        (Pydantic 검증은 입력인 CallToolRequest에서만 수행)
+        """
         try:
             if method == "list_tools":
-                request = ListToolsRequest()
-                response = await self.handle_list_tools(request)
-                return MCPResponse(
-                    success=True,
-                    data=response.model_dump()
-                ).model_dump()
+                # 캐시된 정의 dict를 그대로 사용 (ListToolsResponse 생성/덤프 생략)
+                return {"success": True, "data": {"tools": tool_registry.list_tools_as_dicts()}, "error": None}
             
             elif method == "call_tool":
                 if not params:
@@ -85,10 +84,7 @@ class MCPHandler:
                 
                 request = CallToolRequest(**params)
                 response = await self.handle_call_tool(request)
-                return MCPResponse(
-                    success=True,
-                    data=response.model_dump()
-                ).model_dump()
+                return {"success": True, "data": response.model_dump(), "error": None}
             
             else:
                 raise HTTPException(status_code=400, detail=f"Unknown method: {method}")
@@ -97,13 +93,14 @@ class MCPHandler:
             raise
         except Exception as e:
             logger.error(f"Request handling failed: {e}", method=method, params=params)
-            return MCPResponse(
-                success=False,
-                error=MCPError(
+            return {
+                "success": False,
+                "data": None,
+                "error": MCPError(
                     code=ErrorCode.INTERNAL_ERROR,
                     message=f"Request handling failed: {str(e)}"
-                )
-            ).model_dump()
+                ).to_dict()
+            }
 
 
 # 전역 핸들러 인스턴스
@@ -0,0 +1 @@
+# Test adapters module
@@ -0,0 +1,174 @@
+"""
+Discord HTTP 클라이언트 단위 테스트
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from adapters.discord.http import DiscordClient
+
+
+class FakeSender:
+    """_send_request 대체 (호출 횟수 기록, release 전까지 응답 대기)"""
+    
+    def __init__(self, result=None, error=None):
+        self.calls = []
+        self.result = result
+        self.error = error
+        self.release = asyncio.Event()
+    
+    async def __call__(self, method, endpoint, data=None, params=None, use_cache=False, cache_ttl=300, raw=False):
+        self.calls.append((method, endpoint, params))
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture
+def client():
+    """테스트 클라이언트 (실제 연결 없음)"""
+    return DiscordClient("test_token")
+
+
+@pytest.mark.asyncio
+async def test_single_get_request(client):
+    """단일 GET 요청은 그대로 전송되고 진행 중 목록에서 정리됨"""
+    sender = FakeSender(result={"id": "1"})
+    client._send_request = sender
+    sender.release.set()
+    
+    result = await client._make_request("GET", "/channels/1", params={"limit": 1})
+    
+    assert result == {"id": "1"}
+    assert sender.calls == [("GET", "/channels/1", {"limit": 1})]
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_requests_are_coalesced(client):
+    """동일한 GET 요청이 동시에 들어오면 한 번만 전송"""
+    sender = FakeSender(result={"id": "1"})
+    client._send_request = sender
+    
+    first = asyncio.create_task(client._make_request("GET", "/channels/1"))
+    second = asyncio.create_task(client._make_request("GET", "/channels/1"))
+    await asyncio.sleep(0)
+    sender.release.set()
+    
+    assert await asyncio.gather(first, second) == [{"id": "1"}, {"id": "1"}]
+    assert len(sender.calls) == 1
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_first_caller_does_not_cancel_others(client):
+    """첫 호출자가 취소되어도 같은 요청을 기다리는 다른 호출자는 결과를 받음"""
+    sender = FakeSender(result={"id": "1"})
+    client._send_request = sender
+    
+    first = asyncio.create_task(client._make_request("GET", "/channels/1"))
+    second = asyncio.create_task(client._make_request("GET", "/channels/1"))
+    await asyncio.sleep(0)
+    
+    first.cancel()
+    await asyncio.sleep(0)
+    sender.release.set()
+    
+    assert await second == {"id": "1"}
+    assert first.cancelled()
+    assert len(sender.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesced_request_error_reaches_all_callers(client):
+    """공유 요청이 실패하면 모든 호출자에게 같은 예외가 전달됨"""
+    sender = FakeSender(error=ValueError("boom"))
+    client._send_request = sender
+    
+    first = asyncio.create_task(client._make_request("GET", "/channels/1"))
+    second = asyncio.create_task(client._make_request("GET", "/channels/1"))
+    await asyncio.sleep(0)
+    sender.release.set()
+    
+    results = await asyncio.gather(first, second, return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_non_get_requests_are_not_coalesced(client):
+    """GET 이외의 요청은 병합하지 않음"""
+    sender = FakeSender(result={})
+    client._send_request = sender
+    sender.release.set()
+    
+    await asyncio.gather(
+        client._make_request("POST", "/channels/1/messages", data={"content": "a"}),
+        client._make_request("POST", "/channels/1/messages", data={"content": "a"}),
+    )
+    
+    assert len(sender.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_messages_with_cursor_skips_cache(client):
+    """before/around 페이지 조회는 캐시 키로 구분되지 않으므로 캐시를 사용하지 않음"""
+    client._make_request_with_retry = AsyncMock(return_value=b"[]")
+    
+    with patch("adapters.discord.http.discord_cache") as cache:
+        cache.get_messages = AsyncMock(return_value=b"[]")
+        cache.set_messages = AsyncMock()
+        
+        assert await client.get_messages("1", limit=100, before="500") == []
+        assert await client.get_messages("1", limit=100, around="500") == []
+        
+        cache.get_messages.assert_not_awaited()
+        cache.set_messages.assert_not_awaited()
+        assert client._make_request_with_retry.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_invalidation_is_requeued(client):
+    """캐시 무효화가 실패하면 채널을 대기열로 되돌리고 종료 시 다시 시도"""
+    client.invalidation_delay = 0
+    with patch("adapters.discord.http.discord_cache") as mock_cache:
+        mock_cache.invalidate_channels = AsyncMock(side_effect=[ConnectionError("redis down"), None])
+        
+        client._invalidate_channel_later("1")
+        client._invalidate_channel_later("2")
+        task = client._invalidation_task
+        await asyncio.wait([task])
+        
+        # 예외는 작업 밖으로 빠져나가지 않고 채널은 다시 대기
+        assert task.exception() is None
+        assert client._pending_invalidations == {"1", "2"}
+        
+        await client.disconnect()
+    
+    assert mock_cache.invalidate_channels.await_count == 2
+    assert sorted(mock_cache.invalidate_channels.await_args.args[0]) == ["1", "2"]
+    assert client._pending_invalidations == set()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_flushes_cancelled_invalidation(client):
+    """무효화 도중 종료되면 취소된 채널까지 다시 무효화"""
+    started = asyncio.Event()
+    calls = []
+    
+    async def invalidate_channels(channel_ids):
+        calls.append(sorted(channel_ids))
+        if len(calls) == 1:
+            started.set()
+            await asyncio.Event().wait()
+    
+    client.invalidation_delay = 0
+    with patch("adapters.discord.http.discord_cache") as mock_cache:
+        mock_cache.invalidate_channels = invalidate_channels
+        
+        client._invalidate_channel_later("1")
+        await asyncio.wait_for(started.wait(), timeout=1)
+        await client.disconnect()
+    
+    assert calls == [["1"], ["1"]]
+    assert client._pending_invalidations == set()
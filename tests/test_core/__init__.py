@@ -0,0 +1 @@
+# Test core module
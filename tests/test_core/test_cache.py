@@ -0,0 +1,223 @@
+"""
+캐시 단위 테스트
+"""
+import orjson
+import pytest
+from core.cache import CacheManager, DiscordCache, LocalTTLCache
+
+
+class FakePipeline:
+    """명령을 모았다가 execute에서 순서대로 실행"""
+    
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+    
+    def __getattr__(self, name):
+        def queue(*args):
+            self.commands.append((name, args))
+            return self
+        return queue
+    
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [await getattr(self.redis, name)(*args, _counted=False) for name, args in self.commands]
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+class FakeRedis:
+    """dict 기반 Redis 대체 (사용하는 명령만, 왕복 횟수 기록)"""
+    
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+        self.round_trips = 0
+        self.commands = []
+    
+    def _count(self, name, counted):
+        self.commands.append(name)
+        if counted:
+            self.round_trips += 1
+    
+    async def get(self, key, _counted=True):
+        self._count("get", _counted)
+        return self.values.get(key)
+    
+    async def mget(self, keys, _counted=True):
+        self._count("mget", _counted)
+        return [self.values.get(key) for key in keys]
+    
+    async def setex(self, key, ttl, value, _counted=True):
+        self._count("setex", _counted)
+        self.values[key] = value
+        return True
+    
+    async def sadd(self, key, member, _counted=True):
+        self._count("sadd", _counted)
+        self.sets.setdefault(key, set()).add(member.encode())
+        return 1
+    
+    async def expire(self, key, ttl, _counted=True):
+        self._count("expire", _counted)
+        return True
+    
+    async def smembers(self, key, _counted=True):
+        self._count("smembers", _counted)
+        return set(self.sets.get(key, ()))
+    
+    async def delete(self, *keys, _counted=True):
+        self._count("delete", _counted)
+        deleted = 0
+        for key in keys:
+            key = key.decode() if isinstance(key, bytes) else key
+            deleted += self.values.pop(key, None) is not None
+            deleted += self.sets.pop(key, None) is not None
+        return deleted
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def fake_redis():
+    """Fake Redis 백엔드"""
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(fake_redis):
+    """Fake Redis에 연결된 Discord 캐시"""
+    manager = CacheManager()
+    manager._redis = fake_redis
+    return DiscordCache(manager)
+
+
+def test_local_cache_expires_and_evicts_lru():
+    """L1 캐시: TTL이 지나면 만료, 최대 크기를 넘으면 가장 오래 사용되지 않은 항목 제거"""
+    local = LocalTTLCache(maxsize=2, ttl=30.0)
+    local.set("a", b'{"n":1}')
+    local.set("b", b'{"n":2}')
+    assert local.get("a") == {"n": 1}
+    
+    local.set("c", b'{"n":3}')
+    assert local.get("b") is None
+    assert local.get("a") == {"n": 1}
+    
+    expired = LocalTTLCache(ttl=0.0)
+    expired.set("a", b'{"n":1}')
+    assert expired.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_local_cache_returns_independent_copies(cache):
+    """L1에서 받은 dict를 수정해도 다른 호출 측과 캐시에 영향 없음"""
+    guild = {"id": "1", "name": "Guild", "features": ["NEWS"]}
+    await cache.set_guild("1", guild)
+    guild["name"] = "changed by caller"
+    
+    first = await cache.get_guild("1")
+    first["name"] = "mutated"
+    first["features"].append("MUTATED")
+    second = await cache.get_guild("1")
+    
+    assert second == {"id": "1", "name": "Guild", "features": ["NEWS"]}
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_get_guild_uses_local_cache_then_redis(cache, fake_redis):
+    """L1 히트는 Redis를 조회하지 않고, L1 미스는 Redis 값으로 L1을 채움"""
+    fake_redis.values["discord:guild:1"] = orjson.dumps({"id": "1", "name": "Guild"})
+    
+    assert await cache.get_guild("1") == {"id": "1", "name": "Guild"}
+    assert await cache.get_guild("1") == {"id": "1", "name": "Guild"}
+    assert fake_redis.commands.count("get") == 1
+    assert await cache.get_guild("2") is None
+
+
+@pytest.mark.asyncio
+async def test_get_channels_fetches_misses_with_one_mget(cache, fake_redis):
+    """여러 채널 조회는 L1 미스만 MGET 한 번으로 가져옴"""
+    await cache.set_channel("1", {"id": "1", "guild_id": "9"})
+    fake_redis.values["discord:channel:2"] = orjson.dumps({"id": "2", "guild_id": "9"})
+    fake_redis.round_trips = 0
+    fake_redis.commands.clear()
+    
+    channels = await cache.get_channels(["1", "2", "3"])
+    
+    assert channels == [{"id": "1", "guild_id": "9"}, {"id": "2", "guild_id": "9"}, None]
+    assert fake_redis.commands == ["mget"]
+    # 두 번째 조회는 없는 채널만 다시 확인
+    await cache.get_channels(["1", "2", "3"])
+    assert fake_redis.commands == ["mget", "mget"]
+
+
+@pytest.mark.asyncio
+async def test_get_messages_batch_uses_one_mget(cache, fake_redis):
+    """여러 메시지 목록은 MGET 한 번으로 가져옴"""
+    await cache.set_messages("1", b'[{"id":"10"}]', limit=50)
+    fake_redis.commands.clear()
+    
+    result = await cache.get_messages_batch([("1", 50, None), ("2", 50, None)])
+    
+    assert result == [b'[{"id":"10"}]', None]
+    assert fake_redis.commands == ["mget"]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_channels_deletes_indexed_keys(cache, fake_redis):
+    """채널 무효화는 인덱스에 등록된 채널 정보/메시지 목록만 2회 왕복으로 삭제"""
+    await cache.set_channel("1", {"id": "1", "guild_id": "9"})
+    await cache.set_messages("1", b"[]", limit=50)
+    await cache.set_messages("1", b"[]", limit=100, after="5")
+    await cache.set_channel("2", {"id": "2", "guild_id": "9"})
+    await cache.set_messages("2", b"[]", limit=50)
+    fake_redis.round_trips = 0
+    
+    await cache.invalidate_channels(["1"])
+    
+    assert fake_redis.round_trips == 2
+    assert sorted(fake_redis.values) == ["discord:channel:2", "discord:message:list:2:50:_"]
+    assert "discord:idx:channel:1" not in fake_redis.sets
+    # L1에서도 제거되어 Redis를 다시 조회
+    assert await cache.get_channel("1") is None
+    assert await cache.get_channel("2") == {"id": "2", "guild_id": "9"}
+
+
+@pytest.mark.asyncio
+async def test_invalidate_guild_removes_guild_channels(cache, fake_redis):
+    """길드 무효화는 길드 정보와 해당 길드의 채널만 제거 (L1 포함)"""
+    await cache.set_guild("9", {"id": "9", "name": "Guild"})
+    await cache.set_channel("1", {"id": "1", "guild_id": "9"})
+    await cache.set_channel("2", {"id": "2", "guild_id": "8"})
+    
+    await cache.invalidate_guild("9")
+    
+    assert sorted(fake_redis.values) == ["discord:channel:2"]
+    assert await cache.get_guild("9") is None
+    assert await cache.get_channel("1") is None
+    assert await cache.get_channel("2") == {"id": "2", "guild_id": "8"}
+
+
+@pytest.mark.asyncio
+async def test_null_redis_backend():
+    """Redis 미연결 시 no-op 백엔드로 동작하고 L1만 사용"""
+    manager = CacheManager()
+    cache = DiscordCache(manager)
+    
+    assert await manager.get("key") is None
+    assert await manager.get_many(["a", "b"]) == [None, None]
+    assert await manager.set("key", {"a": 1}) is False
+    assert await manager.set("key", {"a": 1}, indexes=("idx",)) is False
+    assert await manager.delete_indexed(["idx"], ["key"]) == 0
+    
+    assert await cache.set_channel("1", {"id": "1", "guild_id": "9"}) is False
+    assert await cache.get_channel("1") == {"id": "1", "guild_id": "9"}
+    assert await cache.get_messages_batch([("1", 50, None)]) == [None]
+    await cache.invalidate_channels(["1"])
+    assert await cache.get_channel("1") is None
@@ -0,0 +1,218 @@
+"""
+로그 헬퍼 단위 테스트
+"""
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+import orjson
+import pytest
+from unittest.mock import MagicMock, patch
+from loguru import logger
+from core import logging as core_logging
+
+
+@pytest.fixture
+def written():
+    """직접 기록되는 로그 레코드 수집 (setup_logging 이후 상태)"""
+    records = []
+    with patch.object(core_logging, "_configured", True), \
+            patch.object(core_logging, "_write_json_record", records.append):
+        yield records
+
+
+@pytest.mark.parametrize("level_no, expected", [(20, 2), (40, 2), (50, 0)])
+def test_error_logs_respect_min_level(written, level_no, expected):
+    """에러 로그도 최소 레벨(LOG_LEVEL) 미만이면 기록하지 않음"""
+    with patch.object(core_logging, "_min_level_no", level_no):
+        core_logging.log_tool_call("discord.send_message", success=False, error_message="boom")
+        core_logging.log_discord_api_call("GET", "/channels/1", 500, 12.5)
+    
+    assert len(written) == expected
+    assert all(record["level"] == "ERROR" for record in written)
+
+
+def test_success_logs_skipped_above_info(written):
+    """성공 로그는 INFO 미만 설정에서만 기록"""
+    with patch.object(core_logging, "_min_level_no", 30):
+        core_logging.log_tool_call("discord.send_message")
+        core_logging.log_discord_api_call("GET", "/channels/1", 200, 12.5)
+        core_logging.log_discord_api_call("GET", "/channels/1", 429, 12.5)
+    
+    assert [record["level"] for record in written] == ["WARNING"]
+
+
+def test_tool_call_record_fields(written):
+    """툴 호출 레코드 필드"""
+    with patch.object(core_logging, "_min_level_no", 20):
+        core_logging.log_tool_call("discord.send_message", channel_id="1", latency_ms=3.0, extra="x")
+    
+    record = written[0]
+    assert record["message"] == "Tool call completed"
+    assert record["tool"] == "discord.send_message"
+    assert record["channel_id"] == "1"
+    assert record["latency_ms"] == 3.0
+    assert record["extra"] == "x"
+
+
+def test_no_stdout_before_setup_logging():
+    """setup_logging 전에는 stdout에 직접 쓰지 않고 loguru 기본 핸들러(stderr)를 따름"""
+    code = (
+        "from core.logging import log_tool_call, log_discord_api_call\n"
+        "log_tool_call('discord.send_message', success=False, error_message='boom')\n"
+        "log_discord_api_call('GET', '/channels/1', 200, 12.5)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(core_logging.__file__).resolve().parents[1],
+        capture_output=True,
+        check=True
+    )
+    
+    assert result.stdout == b""
+    assert b"Tool call failed" in result.stderr
+    assert b"Discord API call successful" in result.stderr
+
+
+def test_direct_record_matches_formatter(written):
+    """직접 기록한 레코드와 JSONFormatter 레코드의 필드 구성이 같음"""
+    formatted = []
+    handler_id = logger.add(
+        lambda message: formatted.append(orjson.loads(str(message))),
+        format=core_logging._FORMATTER.format
+    )
+    try:
+        with patch.object(core_logging, "_min_level_no", 20):
+            core_logging.log_tool_call("discord.send_message", channel_id="1")
+            with patch.object(core_logging, "_configured", False):
+                core_logging.log_tool_call("discord.send_message", channel_id="1")
+    finally:
+        logger.remove(handler_id)
+    
+    direct = written[0]
+    via_loguru = formatted[-1]
+    assert list(direct) == list(via_loguru)
+    for key in ("level", "message", "module", "function", "line", "tool", "success", "channel_id"):
+        assert direct[key] == via_loguru[key]
+
+
+def wait_for_file(path: Path, content: bytes, timeout: float = 2.0) -> None:
+    """writer 스레드가 content를 기록할 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists() and content in path.read_bytes():
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"{content!r} not written to {path}")
+
+
+def test_file_writer_close_flushes_queue(tmp_path):
+    """close는 큐에 남은 라인을 모두 기록한 뒤 종료"""
+    path = tmp_path / "discord-mcp.log"
+    writer = core_logging.LogFileWriter(str(path), batch_size=4)
+    for i in range(100):
+        writer.write_bytes(b"line %d\n" % i)
+    writer.close()
+    
+    assert path.read_bytes().splitlines() == [b"line %d" % i for i in range(100)]
+    assert writer.dropped == 0
+    # 두 번 닫아도 안전
+    writer.close()
+
+
+def test_file_writer_rotation_and_retention(tmp_path):
+    """로테이션 시 현재 파일을 타임스탬프 이름으로 옮기고 보관 기간이 지난 파일만 삭제"""
+    path = tmp_path / "discord-mcp.log"
+    expired = tmp_path / "discord-mcp.2000-01-01_00-00-00_000000.log"
+    recent = tmp_path / "discord-mcp.2999-01-01_00-00-00_000000.log"
+    unrelated = tmp_path / "other.log"
+    for old in (expired, recent, unrelated):
+        old.write_bytes(b"old\n")
+    stale = time.time() - 31 * 86400
+    os.utime(expired, (stale, stale))
+    os.utime(unrelated, (stale, stale))
+    
+    writer = core_logging.LogFileWriter(str(path))
+    writer.write_bytes(b"first\n")
+    wait_for_file(path, b"first\n")
+    
+    # 로테이션 시각 도달
+    writer._rotate_at = 0.0
+    writer.write_bytes(b"second\n")
+    writer.close()
+    
+    rotated = [
+        p for p in tmp_path.glob("discord-mcp.*.log")
+        if p not in (expired, recent)
+    ]
+    assert path.read_bytes() == b"second\n"
+    assert [p.read_bytes() for p in rotated] == [b"first\n"]
+    assert not expired.exists()
+    assert recent.exists()
+    assert unrelated.exists()
+
+
+def test_file_writer_reports_write_failure_once(tmp_path):
+    """기록 실패는 한 번만 WARNING으로 알리고 버린 라인 수를 셈"""
+    writer = core_logging.LogFileWriter(str(tmp_path / "discord-mcp.log"), batch_size=1)
+    with patch.object(core_logging, "logger", MagicMock()) as mock_logger, \
+            patch.object(writer, "_write_batch", side_effect=OSError(28, "No space left on device")):
+        for _ in range(3):
+            writer.write_bytes(b"line\n")
+        writer.close()
+    
+    assert writer.dropped == 3
+    mock_logger.warning.assert_called_once()
+    assert mock_logger.warning.call_args.kwargs["kind"] == "write"
+
+
+def test_file_writer_bounded_queue(tmp_path):
+    """디스크가 밀리면 큐 크기 이상 쌓지 않고 버린 뒤 한 번만 알림"""
+    release = threading.Event()
+    writer = core_logging.LogFileWriter(str(tmp_path / "discord-mcp.log"), batch_size=1, max_queue_size=2)
+    write_batch = writer._write_batch
+    
+    def slow_write_batch(batch):
+        release.wait(timeout=2)
+        write_batch(batch)
+    
+    with patch.object(core_logging, "logger", MagicMock()) as mock_logger, \
+            patch.object(writer, "_write_batch", side_effect=slow_write_batch):
+        writer.write_bytes(b"first\n")
+        wait_for_queue = time.monotonic() + 2
+        while not writer._queue.empty() and time.monotonic() < wait_for_queue:
+            time.sleep(0.01)
+        for _ in range(5):
+            writer.write_bytes(b"line\n")
+        
+        # 첫 줄은 기록 중, 큐에는 2줄만 남고 나머지는 버림
+        assert writer._queue.qsize() == 2
+        assert writer.dropped == 3
+        release.set()
+        writer.close()
+    
+    mock_logger.warning.assert_called_once()
+    assert mock_logger.warning.call_args.kwargs["kind"] == "queue_full"
+
+
+def test_setup_logging_flushes_file_on_exit(tmp_path):
+    """프로세스 종료 시(atexit) 파일 writer에 남은 로그를 기록"""
+    code = (
+        "from core.logging import setup_logging, log_tool_call\n"
+        "setup_logging('INFO')\n"
+        "for _ in range(50):\n"
+        "    log_tool_call('discord.send_message')\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(core_logging.__file__).resolve().parents[1],
+        env={**os.environ, "LOG_DIR": str(tmp_path)},
+        capture_output=True,
+        check=True
+    )
+    
+    lines = (tmp_path / "discord-mcp.log").read_bytes().splitlines()
+    assert len(lines) == 50
+    assert orjson.loads(lines[-1])["tool"] == "discord.send_message"
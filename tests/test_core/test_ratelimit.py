@@ -0,0 +1,208 @@
+"""
+Rate limit 단위 테스트
+"""
+import asyncio
+import time
+import pytest
+from core.ratelimit import RateLimiter, DiscordRateLimiter, _route_for
+
+
+def rate_limit_headers(bucket: str, remaining: int, reset_after: float = 1.0) -> dict:
+    """테스트용 Discord rate limit 응답 헤더"""
+    return {
+        "X-RateLimit-Bucket": bucket,
+        "X-RateLimit-Limit": "5",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset-After": str(reset_after),
+    }
+
+
+def test_acquire_deducts_tokens():
+    """토큰이 있으면 차감하고, 소진되면 리셋까지 남은 시간 반환"""
+    limiter = RateLimiter()
+    
+    # 모르는 버킷은 바로 통과
+    assert limiter.acquire("bucket") == 0.0
+    
+    limiter.update_rate_limit("bucket", remaining=2, reset_after=10.0, limit=2)
+    assert limiter.acquire("bucket") == 0.0
+    assert limiter.acquire("bucket") == 0.0
+    
+    # 검증: 토큰 소진 후에는 차감 없이 대기 시간만 반환
+    assert limiter.acquire("bucket") == pytest.approx(10.0, abs=0.5)
+    assert limiter.get_remaining_requests("bucket") == 0
+    assert limiter.is_rate_limited("bucket") is True
+
+
+def test_acquire_after_window_reset():
+    """윈도우가 리셋되면 버킷 상태를 버리고 통과"""
+    limiter = RateLimiter()
+    limiter.update_rate_limit("bucket", remaining=0, reset_after=0.0, reset_at=time.monotonic() - 1)
+    
+    assert limiter.acquire("bucket") == 0.0
+    assert limiter.get_remaining_requests("bucket") == 999
+    assert limiter.get_reset_time("bucket") == 0.0
+
+
+def test_global_limit_blocks_all_buckets():
+    """글로벌 제한은 버킷과 관계없이 적용"""
+    limiter = RateLimiter()
+    limiter.update_rate_limit("bucket", remaining=5, reset_after=10.0, limit=5)
+    limiter.update_rate_limit("global", remaining=0, reset_after=10.0, is_global=True)
+    
+    assert limiter.acquire("bucket") == pytest.approx(10.0, abs=0.5)
+    assert limiter.acquire("other") == pytest.approx(10.0, abs=0.5)
+    assert limiter.is_rate_limited("other") is True
+    # 글로벌 대기 중에는 버킷 토큰을 차감하지 않음
+    assert limiter.get_remaining_requests("bucket") == 5
+    
+    # 글로벌 윈도우가 지나면 해제
+    limiter.update_rate_limit("global", remaining=0, reset_after=0.0, is_global=True, reset_at=time.monotonic() - 1)
+    assert limiter.acquire("bucket") == 0.0
+    assert limiter.get_remaining_requests("bucket") == 4
+    assert limiter.is_rate_limited("other") is False
+
+
+@pytest.mark.asyncio
+async def test_wait_for_rate_limit_waits_for_reset():
+    """토큰이 소진되면 윈도우 리셋까지 대기"""
+    limiter = RateLimiter()
+    limiter.update_rate_limit("bucket", remaining=0, reset_after=0.05)
+    
+    started = time.monotonic()
+    await asyncio.wait_for(limiter.wait_for_rate_limit("bucket"), timeout=1)
+    
+    assert time.monotonic() - started >= 0.04
+    assert limiter.acquire("bucket") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_wait_for_rate_limit_keeps_lock_for_queued_waiters():
+    """대기자가 남아 있으면 버킷 락을 정리하지 않음"""
+    limiter = RateLimiter()
+    limiter.update_rate_limit("bucket", remaining=0, reset_after=0.05)
+    
+    # 락을 잡은 상태에서 acquire가 볼 때의 버킷 락을 기록
+    seen_locks = []
+    acquire = limiter.acquire
+    
+    def recording_acquire(bucket):
+        seen_locks.append(limiter._locks.get(bucket))
+        return acquire(bucket)
+    
+    limiter.acquire = recording_acquire
+    
+    # 첫 호출이 락을 잡은 뒤 나머지는 락에서 대기
+    waiters = [asyncio.create_task(limiter.wait_for_rate_limit("bucket")) for _ in range(3)]
+    await asyncio.sleep(0)
+    lock = limiter._locks["bucket"]
+    
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+    
+    # 검증: 락을 넘겨받은 대기자도 같은 락을 보고, 끝난 뒤에는 정리됨
+    assert len(seen_locks) == 4
+    assert all(seen is lock for seen in seen_locks)
+    assert limiter._locks == {}
+    assert limiter._lock_users == {}
+
+
+@pytest.mark.parametrize("method,endpoint,route", [
+    ("GET", "/channels/1/messages", "GET /channels/1/messages"),
+    ("GET", "/channels/1/messages/22", "GET /channels/1/messages/:id"),
+    ("DELETE", "/channels/1/messages/22/reactions/%F0%9F%91%8D/@me", "DELETE /channels/1/messages/:id/reactions/%F0%9F%91%8D/@me"),
+    ("PATCH", "/guilds/5/members/7", "PATCH /guilds/5/members/:id"),
+    ("POST", "/webhooks/3/token", "POST /webhooks/3/token"),
+    ("GET", "/users/@me/guilds", "GET /users/@me/guilds"),
+])
+def test_route_for_templates_minor_ids(method, endpoint, route):
+    """주요 파라미터만 남기고 나머지 ID는 :id로 치환"""
+    assert _route_for(method, endpoint) == route
+
+
+def test_bucket_for_learns_header_bucket_per_major_route():
+    """X-RateLimit-Bucket 헤더로 라우트의 실제 버킷을 주요 파라미터별로 학습"""
+    discord_limiter = DiscordRateLimiter()
+    
+    # 처음 보는 라우트는 엔드포인트로 추정
+    assert discord_limiter.bucket_for("GET", "/channels/1/messages/10") == "channels"
+    
+    discord_limiter.handle_rate_limit("/channels/1/messages/10", rate_limit_headers("abc", remaining=4), "GET")
+    
+    # 검증: 같은 라우트(다른 minor ID)는 학습된 버킷을 공유
+    assert discord_limiter.bucket_for("GET", "/channels/1/messages/10") == "abc:1"
+    assert discord_limiter.bucket_for("GET", "/channels/1/messages/11") == "abc:1"
+    assert discord_limiter.get_rate_limit_info("/channels/1/messages/11")[0] == 4
+    
+    # 다른 메서드/다른 채널은 아직 학습되지 않음
+    assert discord_limiter.bucket_for("DELETE", "/channels/1/messages/10") == "channels"
+    assert discord_limiter.bucket_for("GET", "/channels/2/messages/10") == "channels"
+    
+    # 다른 채널은 같은 헤더 버킷이라도 별도 상태
+    discord_limiter.handle_rate_limit("/channels/2/messages/10", rate_limit_headers("abc", remaining=1), "GET")
+    assert discord_limiter.bucket_for("GET", "/channels/2/messages/10") == "abc:2"
+    assert discord_limiter.get_rate_limit_info("/channels/1/messages/10")[0] == 4
+    assert discord_limiter.get_rate_limit_info("/channels/2/messages/10")[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_check_rate_limit_uses_learned_bucket():
+    """학습된 버킷의 토큰을 차감하고, 소진되면 리셋까지 대기"""
+    discord_limiter = DiscordRateLimiter()
+    discord_limiter.handle_rate_limit("/channels/1/messages", rate_limit_headers("abc", remaining=1, reset_after=0.05), "POST")
+    
+    # 남은 토큰 1개는 바로 통과
+    started = time.monotonic()
+    await discord_limiter.check_rate_limit("/channels/1/messages", "POST")
+    assert discord_limiter.rate_limiter.get_remaining_requests("abc:1") == 0
+    
+    # 소진된 뒤에는 윈도우 리셋까지 대기
+    await asyncio.wait_for(discord_limiter.check_rate_limit("/channels/1/messages", "POST"), timeout=1)
+    assert time.monotonic() - started >= 0.04
+
+
+def test_expired_buckets_are_swept():
+    """버킷 수가 기준을 넘으면 윈도우가 지난 버킷을 정리"""
+    limiter = RateLimiter(sweep_threshold=4)
+    past = time.monotonic() - 1
+    for i in range(3):
+        limiter.update_rate_limit(f"expired:{i}", remaining=0, reset_after=0.0, reset_at=past)
+    limiter.update_rate_limit("live", remaining=0, reset_after=10.0)
+    
+    # 기준(4개)에 도달한 뒤 새 버킷이 추가될 때 정리
+    limiter.update_rate_limit("new", remaining=3, reset_after=10.0)
+    
+    assert sorted(limiter._buckets) == ["live", "new"]
+    assert limiter.acquire("live") > 0
+    assert limiter.acquire("expired:0") == 0.0
+
+
+def test_buckets_stay_bounded_across_many_channels():
+    """채널마다 생기는 버킷/라우트가 계속 쌓이지 않음"""
+    discord_limiter = DiscordRateLimiter(max_routes=8)
+    discord_limiter.rate_limiter = RateLimiter(sweep_threshold=8)
+    
+    for channel_id in range(1, 1001):
+        discord_limiter.handle_rate_limit(
+            f"/channels/{channel_id}/messages",
+            rate_limit_headers("abc", remaining=4, reset_after=0.0),
+            "GET"
+        )
+    
+    assert len(discord_limiter._route_to_bucket) == 8
+    assert len(discord_limiter.rate_limiter._buckets) <= 16
+    # 가장 최근 라우트는 남아 있고 오래된 라우트는 추정 버킷으로 돌아감
+    assert discord_limiter.bucket_for("GET", "/channels/1000/messages") == "abc:1000"
+    assert discord_limiter.bucket_for("GET", "/channels/1/messages") == "channels"
+
+
+def test_route_mapping_keeps_recently_used_routes():
+    """응답을 다시 받은 라우트는 최근 라우트로 갱신되어 먼저 제거되지 않음"""
+    discord_limiter = DiscordRateLimiter(max_routes=2)
+    headers = rate_limit_headers("abc", remaining=4)
+    
+    discord_limiter.handle_rate_limit("/channels/1/messages", headers, "GET")
+    discord_limiter.handle_rate_limit("/channels/2/messages", headers, "GET")
+    discord_limiter.handle_rate_limit("/channels/1/messages", headers, "GET")
+    discord_limiter.handle_rate_limit("/channels/3/messages", headers, "GET")
+    
+    assert list(discord_limiter._route_to_bucket) == ["GET /channels/1/messages", "GET /channels/3/messages"]
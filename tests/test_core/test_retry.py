@@ -0,0 +1,74 @@
+"""
+재시도 로직 단위 테스트
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+from core.retry import retry_with_backoff, DiscordAPIError, RateLimitError, TimeoutError
+from core.schema import ErrorCode, MCPError
+
+
+@pytest.fixture
+def sleep():
+    """재시도 대기 기록 (실제로 기다리지 않음)"""
+    with patch("core.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.mark.asyncio
+async def test_first_attempt_success(sleep):
+    """첫 시도가 성공하면 재시도 없이 반환"""
+    func = AsyncMock(return_value={"id": "1"})
+    
+    assert await retry_with_backoff(func, "a", key="b") == {"id": "1"}
+    func.assert_awaited_once_with("a", key="b")
+    sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_retries_with_exponential_backoff(sleep):
+    """재시도 가능한 에러는 1초부터 두 배씩 대기하며 재시도"""
+    func = AsyncMock(side_effect=[TimeoutError("slow"), TimeoutError("slow"), {"id": "1"}])
+    
+    assert await retry_with_backoff(func) == {"id": "1"}
+    assert func.await_count == 3
+    assert [call.args[0] for call in sleep.await_args_list] == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_exhausted_attempts_raise_mcp_error(sleep):
+    """모든 시도가 실패하면 에러 종류에 맞는 MCPError로 변환"""
+    func = AsyncMock(side_effect=TimeoutError("slow"))
+    
+    with pytest.raises(MCPError) as exc_info:
+        await retry_with_backoff(func, max_attempts=4)
+    
+    assert exc_info.value.code == ErrorCode.TIMEOUT_ERROR
+    assert func.await_count == 4
+    assert [call.args[0] for call in sleep.await_args_list] == [1.0, 2.0, 4.0]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_waits_retry_after(sleep):
+    """Rate limit 에러는 retry_after만큼 대기하고, 소진되면 retry_after_ms를 전달"""
+    func = AsyncMock(side_effect=RateLimitError("limited", retry_after=0.25))
+    
+    with pytest.raises(MCPError) as exc_info:
+        await retry_with_backoff(func, max_attempts=2)
+    
+    assert exc_info.value.code == ErrorCode.RATE_LIMITED
+    assert exc_info.value.retry_after_ms == 250
+    assert [call.args[0] for call in sleep.await_args_list] == [0.25]
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_is_raised_immediately(sleep):
+    """재시도할 수 없는 에러는 그대로 전파"""
+    error = DiscordAPIError("forbidden", status_code=403)
+    func = AsyncMock(side_effect=error)
+    
+    with pytest.raises(DiscordAPIError) as exc_info:
+        await retry_with_backoff(func)
+    
+    assert exc_info.value is error
+    func.assert_awaited_once()
+    sleep.assert_not_awaited()
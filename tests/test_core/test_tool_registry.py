@@ -0,0 +1,129 @@
+"""
+툴 레지스트리 입력 검증 단위 테스트
+"""
+import pytest
+from core.schema import MCPError, ErrorCode
+from core.tool_registry import ToolRegistry
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "channel_id": {"type": "string"},
+        "limit": {"type": "integer"},
+        "ratio": {"type": "number"},
+        "pinned": {"type": "boolean"},
+        "keywords": {"type": "array"},
+        "options": {"type": "object"},
+        "note": {"description": "타입 없음"},
+    },
+    "required": ["channel_id"],
+}
+
+# (입력, 기대 에러 메시지 또는 None)
+CASES = [
+    ({"channel_id": "1"}, None),
+    ({"channel_id": "1", "limit": 5, "ratio": 0.5, "pinned": False, "keywords": [], "options": {}}, None),
+    ({"channel_id": "1", "ratio": 3, "note": object(), "extra": True}, None),
+    ({}, "Missing required parameter: channel_id"),
+    ({"limit": 5}, "Missing required parameter: channel_id"),
+    ({"channel_id": 1}, "Invalid type for parameter 'channel_id': expected string"),
+    ({"channel_id": "1", "limit": "5"}, "Invalid type for parameter 'limit': expected integer"),
+    ({"channel_id": "1", "limit": True}, "Invalid type for parameter 'limit': expected integer"),
+    ({"channel_id": "1", "limit": 1.0}, "Invalid type for parameter 'limit': expected integer"),
+    ({"channel_id": "1", "ratio": False}, "Invalid type for parameter 'ratio': expected number"),
+    ({"channel_id": "1", "ratio": "0.5"}, "Invalid type for parameter 'ratio': expected number"),
+    ({"channel_id": "1", "pinned": 1}, "Invalid type for parameter 'pinned': expected boolean"),
+    ({"channel_id": "1", "keywords": ("a",)}, "Invalid type for parameter 'keywords': expected array"),
+    ({"channel_id": "1", "options": []}, "Invalid type for parameter 'options': expected object"),
+]
+
+
+@pytest.fixture
+def registry():
+    """전역 레지스트리와 분리된 레지스트리"""
+    return ToolRegistry()
+
+
+def run_validator(validate, params):
+    """검증 결과를 에러 메시지(통과 시 None)로 변환"""
+    try:
+        validate(params)
+    except MCPError as e:
+        assert e.code == ErrorCode.VALIDATION_ERROR
+        return e.message
+    return None
+
+
+def test_generate_validator_source(registry):
+    """지원하는 스키마는 검증 함수 소스를 생성"""
+    source, namespace = registry._generate_validator_source(SCHEMA)
+    
+    assert source.startswith("def validate(params):")
+    assert namespace["MCPError"] is MCPError
+    # 타입이 없는 필드는 검사 코드를 만들지 않음
+    assert "'note'" not in source
+
+
+@pytest.mark.parametrize("params,message", CASES)
+def test_compiled_validator(registry, params, message):
+    """생성된 검증 함수: 필수 필드 누락/잘못된 타입/integer·number 자리의 bool 거부"""
+    validate = registry._compile_input_validator(SCHEMA)
+    
+    assert "_specialize_input_validator" not in validate.__qualname__
+    assert run_validator(validate, params) == message
+
+
+@pytest.mark.parametrize("params,message", CASES)
+def test_generated_and_specialized_validators_agree(registry, params, message):
+    """생성된 검증 함수와 범용 검증 함수는 같은 결과(기대 에러 메시지)를 냄"""
+    generated = registry._compile_input_validator(SCHEMA)
+    specialized = registry._specialize_input_validator(SCHEMA)
+    
+    assert run_validator(generated, params) == run_validator(specialized, params) == message
+
+
+@pytest.mark.parametrize("schema,params,message", [
+    (
+        {"anyOf": [{"required": ["a"]}, {"required": ["b"]}], "properties": {"a": {"type": "string"}}},
+        {"b": 1},
+        None,
+    ),
+    (
+        {"anyOf": [{"required": ["a"]}, {"required": ["b"]}], "properties": {"a": {"type": "string"}}},
+        {"a": 1},
+        "Invalid type for parameter 'a': expected string",
+    ),
+    (
+        {"properties": {"a": {"anyOf": [{"type": "string"}, {"type": "integer"}]}, "b": {"type": "integer"}}, "required": ["b"]},
+        {"a": 1, "b": 1},
+        None,
+    ),
+    (
+        {"properties": {"a": {"anyOf": [{"type": "string"}, {"type": "integer"}]}, "b": {"type": "integer"}}, "required": ["b"]},
+        {"a": "x"},
+        "Missing required parameter: b",
+    ),
+    (
+        {"properties": {"a": {"anyOf": [{"type": "string"}, {"type": "integer"}]}, "b": {"type": "integer"}}, "required": ["b"]},
+        {"b": True},
+        "Invalid type for parameter 'b': expected integer",
+    ),
+])
+def test_unsupported_schema_falls_back(registry, schema, params, message):
+    """anyOf 등 해석하지 않는 키워드가 있으면 범용 검증 함수 사용 (필수 필드 + 알려진 type만 검사)"""
+    source, _ = registry._generate_validator_source(schema)
+    validate = registry._compile_input_validator(schema)
+    
+    assert source is None
+    assert "_specialize_input_validator" in validate.__qualname__
+    assert run_validator(validate, params) == message
+
+
+def test_invalid_required_falls_back(registry):
+    """소스를 생성할 수 없는 required 값은 범용 검증 함수로 대체"""
+    validate = registry._compile_input_validator({"required": [1], "properties": {}})
+    
+    assert "_specialize_input_validator" in validate.__qualname__
+    assert run_validator(validate, {1: "x"}) is None
+    assert run_validator(validate, {}) == "Missing required parameter: 1"
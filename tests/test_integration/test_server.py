@@ -2,16 +2,18 @@
 서버 통합 테스트
 """
 import pytest
+import pytest_asyncio
 import asyncio
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from unittest.mock import AsyncMock, patch
 from server.main import app
 
 
-@pytest.fixture
-def client():
-    """테스트 클라이언트"""
-    return TestClient(app)
+@pytest_asyncio.fixture
+async def client():
+    """테스트 클라이언트 (스레드 없이 같은 이벤트 루프에서 ASGI 앱 호출)"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
 
 
 @pytest.fixture
@@ -21,18 +23,20 @@ def mock_discord_client():
     return client
 
 
-def test_root_endpoint(client):
+@pytest.mark.asyncio
+async def test_root_endpoint(client):
     """루트 엔드포인트 테스트"""
-    response = client.get("/")
+    response = await client.get("/")
     assert response.status_code == 200
     data = response.json()
     assert data["name"] == "Discord MCP Server"
     assert data["status"] == "running"
 
 
-def test_health_endpoint(client):
+@pytest.mark.asyncio
+async def test_health_endpoint(client):
     """헬스체크 엔드포인트 테스트"""
-    response = client.get("/health")
+    response = await client.get("/health")
     assert response.status_code == 200
     data = response.json()
     assert "status" in data
@@ -40,26 +44,29 @@ def test_health_endpoint(client):
     assert "uptime" in data
 
 
-def test_metrics_endpoint(client):
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client):
     """메트릭 엔드포인트 테스트"""
-    response = client.get("/metrics")
+    response = await client.get("/metrics")
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, dict)
 
 
-def test_list_tools_endpoint(client):
+@pytest.mark.asyncio
+async def test_list_tools_endpoint(client):
     """툴 목록 조회 엔드포인트 테스트"""
-    response = client.post("/mcp/list_tools")
+    response = await client.post("/mcp/list_tools")
     assert response.status_code == 200
     data = response.json()
     assert data["success"] is True
     assert "tools" in data["data"]
 
 
-def test_call_tool_endpoint_invalid_tool(client):
+@pytest.mark.asyncio
+async def test_call_tool_endpoint_invalid_tool(client):
     """잘못된 툴 호출 테스트"""
-    response = client.post("/mcp/call_tool", json={
+    response = await client.post("/mcp/call_tool", json={
         "method": "call_tool",
         "params": {
             "tool": "invalid_tool",
@@ -69,9 +76,10 @@ def test_call_tool_endpoint_invalid_tool(client):
     assert response.status_code == 400
 
 
-def test_mcp_endpoint(client):
+@pytest.mark.asyncio
+async def test_mcp_endpoint(client):
     """MCP 엔드포인트 테스트"""
-    response = client.post("/mcp", json={
+    response = await client.post("/mcp", json={
         "method": "list_tools",
         "params": {}
     })
@@ -100,15 +108,48 @@ async def test_server_startup():
                 pass
 
 
-def test_error_handling(client):
+@pytest.mark.asyncio
+async def test_error_handling(client):
     """에러 핸들링 테스트"""
     # 잘못된 JSON 요청
-    response = client.post("/mcp/call_tool", data="invalid json")
+    response = await client.post("/mcp/call_tool", content="invalid json")
     assert response.status_code == 422
     
     # 잘못된 메서드
-    response = client.post("/mcp", json={
+    response = await client.post("/mcp", json={
         "method": "invalid_method",
         "params": {}
     })
     assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("body", [
+    b'{}',
+    b'{"params": {}}',
+    b'{"method": 1}',
+    b'{"method": "tools/call", "params": [1]}',
+    b'[1]',
+    b'"text"',
+    b'null',
+    b'',
+])
+async def test_call_tool_validation_error_matches_mcp_endpoint(client, body):
+    """/mcp/call_tool의 422 본문은 FastAPI가 MCPRequest로 검증하는 /mcp와 같음"""
+    headers = {"content-type": "application/json"}
+    response = await client.post("/mcp/call_tool", content=body, headers=headers)
+    expected = await client.post("/mcp", content=body, headers=headers)
+    
+    assert response.status_code == expected.status_code == 422
+    assert response.json() == expected.json()
+
+
+@pytest.mark.asyncio
+async def test_call_tool_invalid_json(client):
+    """JSON 문법 오류는 pydantic의 json_invalid 에러로 422 반환"""
+    response = await client.post("/mcp/call_tool", content=b'{"method": ', headers={"content-type": "application/json"})
+    
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["type"] == "json_invalid"
+    assert error["loc"] == ["body"]
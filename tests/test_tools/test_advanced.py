@@ -0,0 +1,152 @@
+"""
+고도화 툴 단위 테스트
+"""
+import orjson
+import pytest
+from unittest.mock import AsyncMock
+from adapters.discord.http import DiscordClient
+from adapters.discord.models import DiscordMessage
+from tools.discord.advanced import (
+    calculate_message_score, summarize_messages, rank_messages,
+    analyze_channel_activity, set_discord_client
+)
+
+
+def make_message(message_id: str, content: str = "hello", **fields) -> DiscordMessage:
+    """테스트용 메시지 생성 (Discord 응답 형태)"""
+    data = {
+        "id": message_id,
+        "channel_id": "1",
+        "content": content,
+        "author": {"id": "10", "username": "alice", "discriminator": "0"},
+        "timestamp": "2024-01-02T03:04:05.000000+00:00",
+    }
+    data.update(fields)
+    return DiscordMessage(**data)
+
+
+@pytest.fixture
+def reacted_message():
+    """리액션/첨부파일이 있는 메시지"""
+    return make_message(
+        "100",
+        content="release notes https://example.com",
+        reactions=[
+            {"count": 3, "me": False, "emoji": {"id": None, "name": "👍"}},
+            {"count": 1, "me": True, "emoji": {"id": None, "name": "🔥"}},
+        ],
+        attachments=[{
+            "id": "5",
+            "filename": "a.png",
+            "size": 1,
+            "url": "https://cdn/a.png",
+            "proxy_url": "https://proxy/a.png",
+        }],
+    )
+
+
+@pytest.fixture
+def mock_discord_client(reacted_message):
+    """Mock Discord 클라이언트"""
+    messages = [reacted_message, make_message("99")]
+    
+    async def iter_messages(channel_id, limit=None, before=None, batch=100):
+        for message in messages[:limit]:
+            yield message
+    
+    client = AsyncMock()
+    client.get_messages.return_value = messages
+    client.iter_messages = iter_messages
+    set_discord_client(client)
+    return client
+
+
+def test_calculate_message_score_dict():
+    """dict 메시지 점수 계산 테스트"""
+    message = {
+        "content": "see www.example.com about Release",
+        "reactions": [{"count": 2}],
+        "embeds": [{}],
+        "attachments": [{}],
+    }
+    # 리액션 2*1.5 + 링크 2.0 + 키워드 1.0 + 임베드 1.0 + 첨부 0.5
+    assert calculate_message_score(message, ["release"]) == 7.5
+
+
+@pytest.mark.asyncio
+async def test_summarize_messages_with_reactions(mock_discord_client):
+    """리액션이 있는 메시지 요약 테스트"""
+    result = await summarize_messages("1", keywords=["release"], min_score=1.0)
+    
+    assert result["summary_messages"] == 1
+    summary = result["messages"][0]
+    assert summary["id"] == "100"
+    # 리액션 4*1.5 + 링크 2.0 + 키워드 1.0 + 첨부 0.5
+    assert summary["score"] == 9.5
+    assert summary["reactions"] == 2
+    assert summary["has_links"] is True
+    assert summary["has_attachments"] is True
+
+
+@pytest.mark.asyncio
+async def test_rank_messages_with_reactions(mock_discord_client):
+    """리액션이 있는 메시지 순위 테스트"""
+    result = await rank_messages("1", sort_by="reactions")
+    
+    ranked = result["ranked_messages"]
+    assert [message["id"] for message in ranked] == ["100", "99"]
+    assert ranked[0]["score"] == 8.5
+    assert ranked[0]["has_attachments"] is True
+    assert ranked[1]["score"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_analyze_channel_activity_with_reactions(mock_discord_client):
+    """리액션이 있는 채널 활동 분석 테스트"""
+    result = await analyze_channel_activity("1", limit=100)
+    
+    assert result["total_messages"] == 2
+    assert result["top_authors"] == [("alice", 2)]
+    assert result["top_reactions"] == [("👍", 3), ("🔥", 1)]
+    assert result["most_active_hours"] == [(3, 2)]
+    assert result["daily_activity"] == {"2024-01-02": 2}
+    assert result["link_ratio"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_analyze_channel_activity_paginates():
+    """limit이 100을 넘으면 before 커서로 여러 페이지를 조회"""
+    # 최신순 메시지 300개 (ID 내림차순)
+    history = [
+        {
+            "id": str(1000 - i),
+            "channel_id": "1",
+            "content": "hello",
+            "author": {"id": str(i % 3), "username": f"user{i % 3}", "discriminator": "0"},
+            "timestamp": "2024-01-02T03:04:05.000000+00:00",
+        }
+        for i in range(300)
+    ]
+    requests = []
+    
+    async def fake_request(method, endpoint, data=None, params=None, use_cache=False, cache_ttl=300, raw=False):
+        requests.append(dict(params))
+        page = history
+        if "before" in params:
+            page = [message for message in history if int(message["id"]) < int(params["before"])]
+        return orjson.dumps(page[:params["limit"]])
+    
+    client = DiscordClient("test_token")
+    client._make_request_with_retry = fake_request
+    set_discord_client(client)
+    
+    result = await analyze_channel_activity("1", limit=1000)
+    
+    assert result["total_messages"] == 300
+    assert result["unique_authors"] == 3
+    assert requests == [
+        {"limit": 100},
+        {"limit": 100, "before": "901"},
+        {"limit": 100, "before": "801"},
+        {"limit": 100, "before": "701"},
+    ]
@@ -1,15 +1,25 @@
 """
 Discord 고도화 기능 MCP 툴
 """
-from typing import Any, Dict, List, Optional
+import heapq
+from collections import Counter
+from contextlib import aclosing
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import re
 from loguru import logger
 
+try:
+    import ahocorasick  # pyahocorasick (선택 의존성)
+except ImportError:
+    ahocorasick = None
+
 from ...core.tool_registry import tool_registry
-from ...core.schema import create_json_schema, DiscordMessage
+from ...core.schema import create_json_schema
 from ...core.logging import log_tool_call, set_request_context
 from ...adapters.discord.http import DiscordClient
+from ...adapters.discord.models import DiscordMessage
 
 
 # Discord 클라이언트 인스턴스
@@ -22,36 +32,130 @@ def set_discord_client(client: DiscordClient) -> None:
     _discord_client = client
 
 
-def calculate_message_score(message: Dict[str, Any], keywords: List[str] = None) -> float:
-    """메시지 중요도 점수 계산"""
+def _build_keyword_matcher(keywords: List[str]) -> Callable[[str], int]:
+    """소문자 본문에 포함된 키워드 수를 세는 함수 생성 (요청마다 한 번)
+    
+    같은 키워드가 목록에 여러 번 있으면 그 수만큼 센다 (키워드별 `in` 검사와 동일).
+    pyahocorasick이 있으면 오토마톤으로 본문을 한 번만 훑고, 없으면 키워드별 검사로 대체
+    """
+    weights = Counter(keyword.lower() for keyword in keywords)
+    # 빈 키워드는 항상 포함된 것으로 취급
+    always = weights.pop("", 0)
+    
+    if ahocorasick is None or not weights:
+        lowered = tuple(weights.items())
+        
+        def count(content_lower: str) -> int:
+            return always + sum(weight for keyword, weight in lowered if keyword in content_lower)
+        
+        return count
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in weights:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    
+    def count(content_lower: str) -> int:
+        matched = {keyword for _, keyword in automaton.iter(content_lower)}
+        return always + sum(weights[keyword] for keyword in matched)
+    
+    return count
+
+
+def _has_links(content: str) -> bool:
+    """링크 포함 여부 (짧은 본문에서는 정규식보다 부분 문자열 검사가 빠름)"""
+    return "http" in content or "www." in content
+
+
+def calculate_message_score(
+    message: Dict[str, Any],
+    keywords: List[str] = None,
+    matcher: Optional[Callable[[str], int]] = None
+) -> float:
+    """메시지 중요도 점수 계산
+    
+    여러 메시지를 채점할 때는 _build_keyword_matcher로 만든 matcher를 넘겨 재사용
+    """
+    if matcher is None and keywords:
+        matcher = _build_keyword_matcher(keywords)
+    reactions = message.get("reactions")
+    reaction_count = sum(reaction.get("count", 0) for reaction in reactions) if reactions else 0
+    return _score_message(
+        message.get("content", ""),
+        reaction_count,
+        message.get("embeds"),
+        message.get("attachments"),
+        matcher
+    )[0]
+
+
+def _score_message(
+    content: str,
+    reaction_count: int,
+    embeds: Any,
+    attachments: Any,
+    matcher: Optional[Callable[[str], int]] = None
+) -> Tuple[float, bool]:
+    """메시지 점수와 링크 포함 여부 (필드를 직접 받아 model_dump 없이 채점)"""
     score = 0.0
     
     # 리액션 수 (가중치 1.5)
-    reactions = message.get("reactions", [])
-    reaction_count = sum(reaction.get("count", 0) for reaction in reactions)
     score += reaction_count * 1.5
     
     # 링크 포함 (가중치 2.0)
-    content = message.get("content", "")
-    if "http" in content or "www." in content:
+    has_links = _has_links(content)
+    if has_links:
         score += 2.0
     
     # 키워드 매칭 (가중치 1.0)
-    if keywords:
-        content_lower = content.lower()
-        for keyword in keywords:
-            if keyword.lower() in content_lower:
-                score += 1.0
+    if matcher is not None:
+        score += matcher(content.lower())
     
     # 임베드 포함 (가중치 1.0)
-    if message.get("embeds"):
+    if embeds:
         score += 1.0
     
     # 첨부파일 포함 (가중치 0.5)
-    if message.get("attachments"):
+    if attachments:
         score += 0.5
     
-    return score
+    return score, has_links
+
+
+def _score_model(
+    message: DiscordMessage,
+    matcher: Optional[Callable[[str], int]] = None
+) -> Tuple[float, bool]:
+    """DiscordMessage를 속성으로 바로 채점"""
+    # 리액션 없는 메시지가 대부분이라 빈 목록은 합산 생략
+    reactions = message.reactions
+    return _score_message(
+        message.content,
+        sum(reaction.count for reaction in reactions) if reactions else 0,
+        message.embeds,
+        message.attachments,
+        matcher
+    )
+
+
+def _hour_and_day(timestamp: str) -> Optional[Tuple[int, str]]:
+    """ISO 8601 타임스탬프의 (시, "YYYY-MM-DD"), 해석할 수 없으면 None
+    
+    Discord 타임스탬프("2024-01-02T03:04:05.000000+00:00")는 문자열을 잘라 바로 읽고,
+    다른 형태만 datetime.fromisoformat으로 해석
+    """
+    if (
+        len(timestamp) >= 16
+        and timestamp[4] == "-" and timestamp[7] == "-" and timestamp[10] == "T"
+        and timestamp[13] == ":" and timestamp[11:13].isdigit() and timestamp[11:13] < "24"
+    ):
+        return int(timestamp[11:13]), timestamp[:10]
+    
+    try:
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except (ValueError, TypeError, AttributeError):
+        return None
+    return dt.hour, str(dt.date())
 
 
 async def summarize_messages(
@@ -75,18 +179,15 @@ async def summarize_messages(
         )
         
         # 메시지 점수 계산 및 정렬
+        matcher = _build_keyword_matcher(keywords) if keywords else None
         scored_messages = []
         for message in messages:
-            message_dict = message.model_dump()
-            score = calculate_message_score(message_dict, keywords)
+            score, has_links = _score_model(message, matcher)
             if score >= min_score:
-                scored_messages.append((message_dict, score))
+                scored_messages.append((message, score, has_links))
         
-        # 점수순 정렬
-        scored_messages.sort(key=lambda x: x[1], reverse=True)
-        
-        # 상위 메시지 선택
-        top_messages = scored_messages[:max_messages]
+        # 점수 상위 메시지 선택 (전체 정렬 없이 상위 max_messages개만, 동점은 원래 순서 유지)
+        top_messages = heapq.nlargest(max_messages, scored_messages, key=itemgetter(1))
         
         # 요약 생성
         summary = {
@@ -98,17 +199,17 @@ async def summarize_messages(
             "min_score": min_score,
             "messages": [
                 {
-                    "id": msg["id"],
-                    "content": msg["content"][:200] + "..." if len(msg["content"]) > 200 else msg["content"],
-                    "author": msg["author"]["username"],
-                    "timestamp": msg["timestamp"],
+                    "id": msg.id,
+                    "content": msg.content[:200] + "..." if len(msg.content) > 200 else msg.content,
+                    "author": msg.author.username,
+                    "timestamp": msg.timestamp,
                     "score": score,
-                    "reactions": len(msg.get("reactions", [])),
-                    "has_links": "http" in msg["content"] or "www." in msg["content"],
-                    "has_embeds": bool(msg.get("embeds")),
-                    "has_attachments": bool(msg.get("attachments"))
+                    "reactions": len(msg.reactions),
+                    "has_links": has_links,
+                    "has_embeds": bool(msg.embeds),
+                    "has_attachments": bool(msg.attachments)
                 }
-                for msg, score in top_messages
+                for msg, score, has_links in top_messages
             ]
         }
         
@@ -141,21 +242,22 @@ async def rank_messages(
         )
         
         # 메시지 점수 계산
+        matcher = _build_keyword_matcher(keywords) if keywords else None
         ranked_messages = []
         for message in messages:
-            message_dict = message.model_dump()
-            score = calculate_message_score(message_dict, keywords)
+            score, has_links = _score_model(message, matcher)
+            content = message.content
             
             ranked_messages.append({
-                "id": message_dict["id"],
-                "content": message_dict["content"][:100] + "..." if len(message_dict["content"]) > 100 else message_dict["content"],
-                "author": message_dict["author"]["username"],
-                "timestamp": message_dict["timestamp"],
+                "id": message.id,
+                "content": content[:100] + "..." if len(content) > 100 else content,
+                "author": message.author.username,
+                "timestamp": message.timestamp,
                 "score": score,
-                "reactions": len(message_dict.get("reactions", [])),
-                "has_links": "http" in message_dict["content"] or "www." in message_dict["content"],
-                "has_embeds": bool(message_dict.get("embeds")),
-                "has_attachments": bool(message_dict.get("attachments"))
+                "reactions": len(message.reactions),
+                "has_links": has_links,
+                "has_embeds": bool(message.embeds),
+                "has_attachments": bool(message.attachments)
             })
         
         # 정렬
@@ -236,71 +338,61 @@ async def analyze_channel_activity(
         raise ValueError("Discord client not initialized")
     
     try:
-        # 최근 메시지 조회
-        messages = await _discord_client.get_messages(
-            channel_id=channel_id,
-            limit=limit
-        )
-        
-        # 분석 데이터 수집
-        author_counts = {}
-        hourly_counts = {}
-        daily_counts = {}
-        reaction_counts = {}
+        # 분석 데이터 수집 (최근 메시지를 페이지 단위로 받으며 바로 집계)
+        total_messages = 0
+        author_counts = Counter()
+        hourly_counts = Counter()
+        daily_counts = Counter()
+        reaction_counts = Counter()
         link_counts = 0
         embed_counts = 0
         
-        for message in messages:
-            msg_dict = message.model_dump()
-            author = msg_dict["author"]["username"]
-            timestamp = msg_dict["timestamp"]
-            
-            # 작성자별 카운트
-            author_counts[author] = author_counts.get(author, 0) + 1
-            
-            # 시간대별 카운트
-            try:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                hour = dt.hour
-                hourly_counts[hour] = hourly_counts.get(hour, 0) + 1
+        # 페이지 커서(before)로 최신 메시지부터 limit개까지 순회 (다음 페이지는 미리 요청됨)
+        async with aclosing(_discord_client.iter_messages(channel_id, limit=limit)) as messages:
+            async for message in messages:
+                total_messages += 1
+                author = message.author.username
+                timestamp = message.timestamp
                 
-                # 일별 카운트
-                day = dt.date()
-                daily_counts[str(day)] = daily_counts.get(str(day), 0) + 1
-            except:
-                pass
-            
-            # 리액션 카운트
-            reactions = msg_dict.get("reactions", [])
-            for reaction in reactions:
-                emoji = reaction.get("emoji", {}).get("name", "unknown")
-                reaction_counts[emoji] = reaction_counts.get(emoji, 0) + reaction.get("count", 0)
-            
-            # 링크 카운트
-            if "http" in msg_dict["content"] or "www." in msg_dict["content"]:
-                link_counts += 1
-            
-            # 임베드 카운트
-            if msg_dict.get("embeds"):
-                embed_counts += 1
+                # 작성자별 카운트
+                author_counts[author] += 1
+                
+                # 시간대별 / 일별 카운트
+                hour_and_day = _hour_and_day(timestamp)
+                if hour_and_day is not None:
+                    hourly_counts[hour_and_day[0]] += 1
+                    daily_counts[hour_and_day[1]] += 1
+                
+                # 리액션 카운트
+                for reaction in message.reactions:
+                    emoji = reaction.emoji.get("name", "unknown")
+                    reaction_counts[emoji] += reaction.count
+                
+                # 링크 카운트
+                if _has_links(message.content):
+                    link_counts += 1
+                
+                # 임베드 카운트
+                if message.embeds:
+                    embed_counts += 1
         
-        # 상위 통계
-        top_authors = sorted(author_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        top_reactions = sorted(reaction_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        top_hours = sorted(hourly_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        # 상위 통계 (most_common: 전체 정렬 없이 상위 N개, 동점은 처음 나온 순서)
+        top_authors = author_counts.most_common(10)
+        top_reactions = reaction_counts.most_common(10)
+        top_hours = hourly_counts.most_common(5)
         
         result = {
             "channel_id": channel_id,
             "analysis_period_days": days,
-            "total_messages": len(messages),
+            "total_messages": total_messages,
             "unique_authors": len(author_counts),
             "top_authors": top_authors,
             "top_reactions": top_reactions,
             "most_active_hours": top_hours,
-            "daily_activity": daily_counts,
-            "link_ratio": link_counts / len(messages) if messages else 0,
-            "embed_ratio": embed_counts / len(messages) if messages else 0,
-            "avg_messages_per_author": len(messages) / len(author_counts) if author_counts else 0
+            "daily_activity": dict(daily_counts),
+            "link_ratio": link_counts / total_messages if total_messages else 0,
+            "embed_ratio": embed_counts / total_messages if total_messages else 0,
+            "avg_messages_per_author": total_messages / len(author_counts) if author_counts else 0
         }
         
         log_tool_call("discord.analyze_channel_activity", channel_id=channel_id, success=True)